@@ -31,6 +31,11 @@ ENV_VAR: str = "OPENROUTER_API_KEY"
 
 OPENROUTER_BASE_URL: str = "https://openrouter.ai/api/v1"
 
+# Cap on concurrent OpenRouter requests per process; overridable via env var.
+MAX_CONCURRENCY_ENV_VAR: str = "CODE_SWAP_MAX_CONC"
+
+DEFAULT_MAX_CONCURRENCY: int = 6
+
 # ---------------------------------------------------------------------------
 # Pricing table  (cost per 1 M tokens, USD)
 # ---------------------------------------------------------------------------
@@ -94,6 +99,7 @@ class AppConfig:
     yolo_mode: bool = False
     auto_route: bool = False
     route_overrides: dict[str, str] | None = None
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY
 
 
 def load_config() -> AppConfig:
@@ -120,6 +126,7 @@ def load_config() -> AppConfig:
         yolo_mode=raw.get("yolo_mode", False),
         auto_route=raw.get("auto_route", False),
         route_overrides=raw.get("route_overrides"),
+        max_concurrency=raw.get("max_concurrency", DEFAULT_MAX_CONCURRENCY),
     )
 
 
@@ -133,6 +140,7 @@ def save_config(cfg: AppConfig) -> Path:
         "auto_resume": cfg.auto_resume,
         "max_sessions": cfg.max_sessions,
         "yolo_mode": cfg.yolo_mode,
+        "max_concurrency": cfg.max_concurrency,
     }
     # Only write the key if set (avoid writing None)
     if cfg.api_key:
@@ -192,6 +200,27 @@ def resolve_api_key(cli_key: str | None = None) -> str:
     )
 
 
+def resolve_max_concurrency() -> int:
+    """Return the request concurrency cap: env var -> config file -> default.
+
+    Values below 1 (or unparseable env values) fall back to the default.
+    """
+    env_val = os.environ.get(MAX_CONCURRENCY_ENV_VAR)
+    if env_val:
+        try:
+            value = int(env_val)
+        except ValueError:
+            value = 0
+        if value >= 1:
+            return value
+
+    value = load_config().max_concurrency
+    # YAML ``true`` loads as a bool, which is also an int.
+    if isinstance(value, int) and not isinstance(value, bool) and value >= 1:
+        return value
+    return DEFAULT_MAX_CONCURRENCY
+
+
 def resolve_model(cli_model: str | None = None) -> str:
     """Resolve the model to use.
 
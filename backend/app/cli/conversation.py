@@ -7,7 +7,9 @@ for use with OpenRouter as the transport layer.
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from functools import lru_cache
 from time import time
+from typing import Any
 
 
 # ---------------------------------------------------------------------------
@@ -40,6 +42,39 @@ def _get_pricing(model: str) -> dict[str, float]:
     return {"input": _DEFAULT_INPUT_RATE, "output": _DEFAULT_OUTPUT_RATE}
 
 
+# ---------------------------------------------------------------------------
+# Token counting
+# ---------------------------------------------------------------------------
+
+@lru_cache(maxsize=1)
+def _token_encoder() -> Any | None:
+    """Return a cached tiktoken encoder, or None if tiktoken is unavailable."""
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+    # Loading the encoding can fail offline if its file is not cached yet.
+    try:
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception:  # noqa: BLE001
+        return None
+
+
+def count_tokens(text: str) -> int:
+    """Count tokens in *text* for usage fallbacks when the API omits them.
+
+    Uses tiktoken's ``cl100k_base`` encoding when the optional ``tokens``
+    extra is installed, else the ~4 characters per token heuristic.
+
+    The first call may download the encoding file, so async callers run it
+    with ``asyncio.to_thread`` to keep the event loop responsive.
+    """
+    enc = _token_encoder()
+    if enc is None:
+        return len(text) // 4
+    return len(enc.encode(text, disallowed_special=()))
+
+
 # ---------------------------------------------------------------------------
 # Message type
 # ---------------------------------------------------------------------------
@@ -84,8 +119,8 @@ class TokenTracker:
         input_tokens: int,
         output_tokens: int,
         model: str,
-    ) -> None:
-        """Record a completed API request."""
+    ) -> float:
+        """Record a completed API request and return its estimated cost."""
         cost = self.estimate_cost(input_tokens, output_tokens, model)
         self._requests.append(
             RequestRecord(
@@ -96,6 +131,7 @@ class TokenTracker:
                 timestamp=time(),
             )
         )
+        return cost
 
     # -- cost estimation --------------------------------------------------
 
@@ -173,21 +209,35 @@ class Conversation:
     _messages: list[Message] = field(default_factory=list)
     _files: set[str] = field(default_factory=set)
     _tracker: TokenTracker = field(default_factory=TokenTracker)
+    _version: int = 0
+    # Running totals so the toolbar and /status read stats in O(1).
+    _chars: int = 0
+    _count: int = 0
 
     def __post_init__(self) -> None:
         # Materialise the system message so it is always at index 0.
         if self.system_prompt:
             self._messages.insert(0, Message(role="system", content=self.system_prompt))
+        self._chars = sum(len(m.content) for m in self._messages)
+        self._count = sum(1 for m in self._messages if m.role != "system")
 
     # -- mutators ---------------------------------------------------------
 
+    def _append(self, message: Message) -> None:
+        """Append *message* and update the running stats."""
+        self._messages.append(message)
+        self._chars += len(message.content)
+        if message.role != "system":
+            self._count += 1
+        self._version += 1
+
     def add_user_message(self, content: str) -> None:
         """Append a user message to the history."""
-        self._messages.append(Message(role="user", content=content))
+        self._append(Message(role="user", content=content))
 
     def add_assistant_message(self, content: str) -> None:
         """Append an assistant response to the history."""
-        self._messages.append(Message(role="assistant", content=content))
+        self._append(Message(role="assistant", content=content))
 
     def add_file_context(self, filename: str, content: str) -> None:
         """Inject a file's contents as a labelled user message.
@@ -200,20 +250,27 @@ class Conversation:
             f"{content}\n"
             f"</file>"
         )
-        self._messages.append(Message(role="user", content=wrapped))
+        self._append(Message(role="user", content=wrapped))
         self._files.add(filename)
 
     def remove_last_message(self) -> None:
         """Remove the most recently added message (for error recovery)."""
         if self._messages and self._messages[-1].role != "system":
-            self._messages.pop()
+            removed = self._messages.pop()
+            self._chars -= len(removed.content)
+            self._count -= 1
+            self._version += 1
 
     def clear(self) -> None:
         """Reset conversation history, keeping the system prompt."""
         self._messages.clear()
         self._files.clear()
+        self._chars = 0
+        self._count = 0
         if self.system_prompt:
             self._messages.insert(0, Message(role="system", content=self.system_prompt))
+            self._chars = len(self.system_prompt)
+        self._version += 1
 
     # -- serialisation ----------------------------------------------------
 
@@ -226,7 +283,7 @@ class Conversation:
     @property
     def message_count(self) -> int:
         """Number of messages excluding the system prompt."""
-        return sum(1 for m in self._messages if m.role != "system")
+        return self._count
 
     @property
     def estimated_tokens(self) -> int:
@@ -234,8 +291,12 @@ class Conversation:
 
         Uses the widely-accepted heuristic of ~4 characters per token.
         """
-        total_chars = sum(len(m.content) for m in self._messages)
-        return total_chars // 4
+        return self._chars // 4
+
+    @property
+    def version(self) -> int:
+        """Counter bumped on every history change, for cheap change detection."""
+        return self._version
 
     @property
     def tracker(self) -> TokenTracker:
@@ -261,9 +322,12 @@ class Conversation:
         """Replace the system prompt (updates the first message in-place)."""
         self.system_prompt = prompt
         if self._messages and self._messages[0].role == "system":
+            self._chars -= len(self._messages[0].content)
             self._messages[0] = Message(role="system", content=prompt)
         else:
             self._messages.insert(0, Message(role="system", content=prompt))
+        self._chars += len(prompt)
+        self._version += 1
 
     # -- persistence ----------------------------------------------------------
 
@@ -294,10 +358,14 @@ class Conversation:
 
     @classmethod
     def from_serializable(cls, data: dict) -> "Conversation":
-        """Reconstruct a Conversation from serialized data."""
+        """Reconstruct a Conversation from serialized data.
+
+        Only ``role`` and ``content`` are read from each message, so message
+        dicts from ``SessionStore.load_session`` can be passed as-is.
+        """
         conv = cls(system_prompt=data.get("system_prompt", DEFAULT_SYSTEM_PROMPT))
         for msg in data.get("messages", []):
-            conv._messages.append(Message(role=msg["role"], content=msg["content"]))
+            conv._append(Message(role=msg["role"], content=msg["content"]))
         for rec in data.get("tracker_records", []):
             conv._tracker._requests.append(
                 RequestRecord(
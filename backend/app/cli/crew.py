@@ -314,16 +314,26 @@ _TEMPLATES: dict[str, str] = {
 }
 
 
+# Set once the crews directory is known to be populated, so repeat calls
+# (every /crew and /run) skip the filesystem entirely.
+_defaults_ensured: bool = False
+
+
 def ensure_default_crews() -> None:
     """Create template crew YAML files if the crews directory is empty.
 
-    Idempotent: does nothing if any ``.yaml`` files already exist.
+    Idempotent: does nothing if any ``.yaml`` files already exist. The check
+    runs once per process; later calls return immediately.
     """
-    CREWS_DIR.mkdir(parents=True, exist_ok=True)
+    global _defaults_ensured
 
-    existing = list(CREWS_DIR.glob("*.yaml"))
-    if existing:
+    if _defaults_ensured:
         return
 
-    for name, content in _TEMPLATES.items():
-        (CREWS_DIR / f"{name}.yaml").write_text(content)
+    CREWS_DIR.mkdir(parents=True, exist_ok=True)
+
+    if next(CREWS_DIR.glob("*.yaml"), None) is None:
+        for name, content in _TEMPLATES.items():
+            (CREWS_DIR / f"{name}.yaml").write_text(content)
+
+    _defaults_ensured = True
@@ -13,6 +13,7 @@ from __future__ import annotations
 import asyncio
 import sys
 import time
+from collections import deque
 from dataclasses import dataclass, field
 
 from rich.console import Console, Group
@@ -46,6 +47,48 @@ class AgentState:
     cost: float = 0.0
 
 
+# ---------------------------------------------------------------------------
+# Event plumbing
+# ---------------------------------------------------------------------------
+
+
+class EventStream:
+    """Single-producer, single-consumer event buffer for one event loop.
+
+    A ``deque`` plus an ``asyncio.Event``: ``push`` is a plain append with
+    no per-item future, and the consumer wakes once per burst and takes
+    everything queued with ``drain``.
+    """
+
+    __slots__ = ("_events", "_ready")
+
+    def __init__(self) -> None:
+        self._events: deque[dict] = deque()
+        self._ready = asyncio.Event()
+
+    def push(self, event: dict) -> None:
+        """Queue *event* and wake the consumer."""
+        self._events.append(event)
+        self._ready.set()
+
+    async def wait(self, timeout: float) -> bool:
+        """Wait up to *timeout* seconds for events; return whether any exist."""
+        if not self._events:
+            try:
+                async with asyncio.timeout(timeout):
+                    await self._ready.wait()
+            except TimeoutError:
+                return False
+        return True
+
+    def drain(self) -> list[dict]:
+        """Remove and return every queued event, oldest first."""
+        self._ready.clear()
+        events = list(self._events)
+        self._events.clear()
+        return events
+
+
 # ---------------------------------------------------------------------------
 # Live display
 # ---------------------------------------------------------------------------
@@ -54,8 +97,8 @@ class AgentState:
 class CrewDisplay:
     """Live terminal display for crew execution.
 
-    Consumes events from an ``asyncio.Queue`` pushed by the crew engine
-    and renders a Rich Live dashboard that updates in real time.
+    Consumes events from an ``EventStream`` fed by the crew engine and
+    renders a Rich Live dashboard that updates in real time.
 
     Event types handled:
         crew_start, plan, agent_start, agent_delta, agent_done,
@@ -76,8 +119,8 @@ class CrewDisplay:
 
     # -- public API ---------------------------------------------------------
 
-    async def run(self, event_queue: asyncio.Queue) -> None:
-        """Consume events from *event_queue* and render live display.
+    async def run(self, events: EventStream) -> None:
+        """Consume events from *events* and render live display.
 
         Blocks until a ``crew_done`` or ``error`` event is received.
         """
@@ -88,19 +131,22 @@ class CrewDisplay:
             transient=False,
         ) as live:
             while True:
-                try:
-                    event = await asyncio.wait_for(
-                        event_queue.get(), timeout=0.2
-                    )
-                except asyncio.TimeoutError:
+                if not await events.wait(0.2):
                     # Re-render on timeout to keep spinner / elapsed ticking
                     live.update(self._render())
                     continue
 
-                self._handle_event(event)
-                live.update(self._render())
+                # Apply everything already queued, then render once for
+                # the whole batch rather than once per event.
+                finished = False
+                for event in events.drain():
+                    self._handle_event(event)
+                    if event.get("type") in ("crew_done", "error"):
+                        finished = True
+                        break
 
-                if event.get("type") in ("crew_done", "error"):
+                live.update(self._render())
+                if finished:
                     break
 
         # Print final summary outside the Live context
@@ -19,13 +19,16 @@ import asyncio
 import json
 import time
 import uuid
+from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
-from typing import Any, Awaitable, Callable
+from typing import Any, AsyncIterator, Awaitable, Callable
 
 import httpx
 
 from app.cli.config import OPENROUTER_BASE_URL, get_model_pricing
+from app.cli.conversation import count_tokens
 from app.cli.crew import AgentDef, CrewConfig
+from app.cli.transport import request_limiter
 
 # ---------------------------------------------------------------------------
 # Data structures
@@ -76,6 +79,10 @@ class CrewEngine:
     on_event:
         Async callback invoked with structured event dicts so the caller can
         render progress in real time.
+    client:
+        Optional shared HTTP client. When given, every model call reuses its
+        connection pool (and HTTP/2 multiplexing) instead of opening a new
+        client per request. The caller owns its lifetime.
     """
 
     def __init__(
@@ -83,10 +90,12 @@ class CrewEngine:
         api_key: str,
         crew: CrewConfig,
         on_event: Callable[[dict[str, Any]], Awaitable[None]],
+        client: httpx.AsyncClient | None = None,
     ) -> None:
         self._api_key = api_key
         self._crew = crew
         self._on_event = on_event
+        self._client = client
         self._total_cost = 0.0
 
     # -- public API ---------------------------------------------------------
@@ -361,6 +370,20 @@ class CrewEngine:
             "X-Title": "code-swap",
         }
 
+    @asynccontextmanager
+    async def _http(self) -> AsyncIterator[httpx.AsyncClient]:
+        """Hold a request slot and yield the shared or a throwaway client.
+
+        The slot comes from the process-wide ``request_limiter()``, so crew
+        fan-out and REPL requests share one concurrency cap.
+        """
+        async with request_limiter():
+            if self._client is not None:
+                yield self._client
+                return
+            async with httpx.AsyncClient(timeout=120.0) as client:
+                yield client
+
     async def _call_model(
         self,
         model: str,
@@ -375,7 +398,7 @@ class CrewEngine:
             "stream": False,
         }
 
-        async with httpx.AsyncClient(timeout=120.0) as client:
+        async with self._http() as client:
             resp = await client.post(
                 f"{OPENROUTER_BASE_URL}/chat/completions",
                 headers=self._request_headers(),
@@ -410,7 +433,7 @@ class CrewEngine:
         input_tokens = 0
         output_tokens = 0
 
-        async with httpx.AsyncClient(timeout=120.0) as client:
+        async with self._http() as client:
             async with client.stream(
                 "POST",
                 f"{OPENROUTER_BASE_URL}/chat/completions",
@@ -461,7 +484,7 @@ class CrewEngine:
         full_text = "".join(chunks)
         # Fallback token estimate when the API omits usage data.
         if not output_tokens:
-            output_tokens = max(1, len(full_text) // 4)
+            output_tokens = max(1, await asyncio.to_thread(count_tokens, full_text))
 
         return full_text, input_tokens, output_tokens
 
@@ -7,6 +7,9 @@ not inside a repository.
 
 from __future__ import annotations
 
+import asyncio
+import codecs
+import re
 import subprocess
 from collections import Counter
 from dataclasses import dataclass, field
@@ -37,7 +40,25 @@ class RepoSummary:
     root: Path
     file_count: int
     language_breakdown: dict[str, int]  # extension -> count
-    tree_preview: str  # first 30 lines of tree output
+    tree_preview: list[str]  # first 30 paths of tree output
+
+
+@dataclass(slots=True)
+class DiffStat:
+    """Totals from ``git diff --shortstat``."""
+
+    files_changed: int
+    insertions: int
+    deletions: int
+
+
+@dataclass(slots=True)
+class FileDiffStat:
+    """One ``git diff --numstat`` row; counts are ``None`` for binary files."""
+
+    path: str
+    insertions: int | None
+    deletions: int | None
 
 
 # ---------------------------------------------------------------------------
@@ -46,6 +67,27 @@ class RepoSummary:
 
 _TIMEOUT = 10  # seconds per subprocess call
 
+# Above this many files /diff loads a per-file summary instead of the patch.
+DIFF_MAX_FILES = 50
+
+# Chunk size for streaming ``git diff`` output.
+_DIFF_READ_CHUNK = 65_536
+
+# Number of paths kept in RepoSummary.tree_preview.
+_TREE_PREVIEW_LINES = 30
+
+# Raw diffs are truncated to this many characters before prompt injection.
+_DIFF_MAX_CHARS = 8_000
+# Bytes of diff read before stopping git: a UTF-8 character is at most four
+# bytes, so this always decodes to at least _DIFF_MAX_CHARS characters.
+_DIFF_MAX_BYTES = 4 * _DIFF_MAX_CHARS
+
+_SHORTSTAT_RE = re.compile(
+    r"(\d+) files? changed"
+    r"(?:, (\d+) insertions?\(\+\))?"
+    r"(?:, (\d+) deletions?\(-\))?"
+)
+
 
 def _git(
     *args: str,
@@ -69,6 +111,41 @@ def _git_lines(*args: str, cwd: Path) -> list[str]:
     return [ln for ln in proc.stdout.splitlines() if ln]
 
 
+async def _agit(*args: str, cwd: Path) -> str | None:
+    """Run a read-only git command without blocking the event loop.
+
+    Returns stdout, or ``None`` if git is missing, fails, or times out.
+    """
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            "git", *args,
+            cwd=cwd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+    except FileNotFoundError:
+        return None
+    try:
+        stdout, _ = await asyncio.wait_for(proc.communicate(), _TIMEOUT)
+    except TimeoutError:
+        proc.kill()
+        await proc.wait()
+        return None
+    if proc.returncode != 0:
+        return None
+    return stdout.decode("utf-8", errors="replace")
+
+
+def _diff_args(staged_only: bool, *extra: str) -> list[str]:
+    return ["diff", "--cached", *extra] if staged_only else ["diff", *extra]
+
+
+def _truncate_diff(diff: str) -> str:
+    if len(diff) > _DIFF_MAX_CHARS:
+        return diff[:_DIFF_MAX_CHARS] + "\n... (truncated)"
+    return diff
+
+
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
@@ -148,6 +225,35 @@ def format_git_context(info: GitInfo) -> str:
     )
 
 
+def repo_state_key(root: Path) -> tuple[str, int, str] | None:
+    """Return a cheap fingerprint of the tracked-file state of *root*.
+
+    The key is ``(root, .git/index mtime_ns, HEAD sha)`` and is read straight
+    from the ``.git`` directory without spawning git. Returns ``None`` when
+    the layout is unusual (worktrees, submodules) so callers skip caching.
+    """
+    git_dir = root / ".git"
+    try:
+        index_mtime = (git_dir / "index").stat().st_mtime_ns
+        head = (git_dir / "HEAD").read_text().strip()
+        if not head.startswith("ref: "):
+            return (str(root), index_mtime, head)  # detached HEAD
+        ref = head[5:]
+        ref_path = git_dir / ref
+        if ref_path.is_file():
+            return (str(root), index_mtime, ref_path.read_text().strip())
+        packed = git_dir / "packed-refs"
+        sha = ""
+        if packed.is_file():
+            for line in packed.read_text().splitlines():
+                if line.endswith(" " + ref):
+                    sha = line.split(" ", 1)[0]
+                    break
+        return (str(root), index_mtime, sha)
+    except OSError:
+        return None
+
+
 def collect_repo_summary(cwd: Path) -> RepoSummary:
     """Build a high-level structural summary of the repo at *cwd*."""
     try:
@@ -157,7 +263,7 @@ def collect_repo_summary(cwd: Path) -> RepoSummary:
             root=cwd,
             file_count=0,
             language_breakdown={},
-            tree_preview="",
+            tree_preview=[],
         )
 
     file_count = len(tracked)
@@ -171,14 +277,17 @@ def collect_repo_summary(cwd: Path) -> RepoSummary:
     # Sort by count descending for readability
     language_breakdown = dict(ext_counter.most_common())
 
-    # Tree preview — first 30 tracked paths
+    # Tree preview — first 30 tracked paths. Bound the split so a large
+    # listing is not broken into one string per file just to keep 30.
     try:
-        tree_lines = _git_lines(
-            "ls-tree", "-r", "--name-only", "HEAD", cwd=cwd
-        )
-        tree_preview = "\n".join(tree_lines[:30])
+        proc = _git("ls-tree", "-r", "--name-only", "HEAD", cwd=cwd)
+        if proc.returncode == 0:
+            head = proc.stdout.split("\n", _TREE_PREVIEW_LINES)[:_TREE_PREVIEW_LINES]
+            tree_preview = [ln for ln in head if ln]
+        else:
+            tree_preview = []
     except (FileNotFoundError, subprocess.TimeoutExpired):
-        tree_preview = ""
+        tree_preview = []
 
     return RepoSummary(
         root=cwd,
@@ -188,23 +297,115 @@ def collect_repo_summary(cwd: Path) -> RepoSummary:
     )
 
 
-def get_full_diff(cwd: Path, staged_only: bool = False) -> str:
-    """Return the current diff (or staged diff) as a string.
+# ---------------------------------------------------------------------------
+# Async diff helpers (used by /diff)
+# ---------------------------------------------------------------------------
+
 
-    Output is truncated at 8 000 characters to avoid blowing up the context
-    window when injected into a prompt.
+async def get_diff_shortstat(cwd: Path, staged_only: bool = False) -> DiffStat | None:
+    """Return the ``git diff --shortstat`` totals, or ``None`` on error.
+
+    A clean tree yields ``DiffStat(0, 0, 0)``.
     """
-    _MAX_CHARS = 8_000
+    out = await _agit(*_diff_args(staged_only, "--shortstat"), cwd=cwd)
+    if out is None:
+        return None
+    m = _SHORTSTAT_RE.search(out)
+    if m is None:
+        return DiffStat(files_changed=0, insertions=0, deletions=0)
+    files, ins, dels = m.groups()
+    return DiffStat(
+        files_changed=int(files),
+        insertions=int(ins or 0),
+        deletions=int(dels or 0),
+    )
+
 
+async def get_diff_numstat(cwd: Path, staged_only: bool = False) -> list[FileDiffStat]:
+    """Return per-file insertion/deletion counts from ``git diff --numstat``."""
+    out = await _agit(*_diff_args(staged_only, "--numstat"), cwd=cwd)
+    if not out:
+        return []
+    rows: list[FileDiffStat] = []
+    for line in out.splitlines():
+        parts = line.split("\t", 2)
+        if len(parts) != 3:
+            continue
+        ins, dels, path = parts
+        rows.append(
+            FileDiffStat(
+                path=path,
+                insertions=int(ins) if ins.isdigit() else None,
+                deletions=int(dels) if dels.isdigit() else None,
+            )
+        )
+    return rows
+
+
+async def read_diff(cwd: Path, staged_only: bool = False) -> str:
+    """Stream the diff in fixed-size chunks, stopping once the prompt cap is reached.
+
+    Returns the diff truncated to ``_DIFF_MAX_CHARS`` characters for prompt
+    injection, or ``""`` on git errors.  Git is killed as soon as
+    ``_DIFF_MAX_BYTES`` bytes are buffered, so neither the full patch nor an
+    over-long line is ever held.
+    """
     try:
-        args = ["diff", "--cached"] if staged_only else ["diff"]
-        proc = _git(*args, cwd=cwd)
-        if proc.returncode != 0:
-            return ""
-        diff = proc.stdout
-    except (FileNotFoundError, subprocess.TimeoutExpired):
+        proc = await asyncio.create_subprocess_exec(
+            "git", *_diff_args(staged_only),
+            cwd=cwd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+    except FileNotFoundError:
         return ""
+    assert proc.stdout is not None
 
-    if len(diff) > _MAX_CHARS:
-        return diff[:_MAX_CHARS] + "\n... (truncated)"
-    return diff
+    buf = bytearray()
+    truncated = False
+    try:
+        async with asyncio.timeout(_TIMEOUT):
+            while chunk := await proc.stdout.read(_DIFF_READ_CHUNK):
+                buf += chunk
+                if len(buf) > _DIFF_MAX_BYTES:
+                    truncated = True
+                    break
+            if not truncated:
+                await proc.wait()
+    except TimeoutError:
+        return ""
+    finally:
+        if proc.returncode is None:
+            proc.kill()
+            await proc.wait()
+
+    if truncated:
+        # Decode without the trailing partial UTF-8 sequence left by the cut.
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        return decoder.decode(bytes(buf))[:_DIFF_MAX_CHARS] + "\n... (truncated)"
+    if proc.returncode != 0:
+        return ""
+    return _truncate_diff(buf.decode("utf-8", errors="replace"))
+
+
+def format_diff_summary(
+    stat: DiffStat,
+    files: list[FileDiffStat],
+    staged_only: bool = False,
+) -> str:
+    """Format a compact ``<git_diff_summary>`` block for oversized diffs."""
+    kind = "staged diff" if staged_only else "diff"
+    lines = [
+        "<git_diff_summary>",
+        f"The full {kind} is too large to include. "
+        f"{stat.files_changed} files changed, "
+        f"{stat.insertions} insertions(+), {stat.deletions} deletions(-).",
+        "",
+    ]
+    for f in files:
+        if f.insertions is None or f.deletions is None:
+            lines.append(f"{f.path}: binary")
+        else:
+            lines.append(f"{f.path}: +{f.insertions} -{f.deletions}")
+    lines.append("</git_diff_summary>")
+    return "\n".join(lines)
@@ -16,6 +16,7 @@ import platform
 import shutil
 import subprocess
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 from app.cli.output import console, print_error, print_info, print_success, print_warning
@@ -230,6 +231,7 @@ def install_pipeline(preference: str = "auto") -> bool:
 # Helpers
 # ---------------------------------------------------------------------------
 
+@lru_cache(maxsize=1)
 def _find_project_root() -> Path | None:
     """Walk up from this file to find the directory containing pyproject.toml."""
     candidate = Path(__file__).resolve().parent
@@ -240,18 +242,20 @@ def _find_project_root() -> Path | None:
     return None
 
 
-def _shell_rc_candidates() -> list[str]:
+@lru_cache(maxsize=1)
+def _shell_rc_candidates() -> tuple[str, ...]:
     """Return shell RC filenames to check."""
     shell = os.environ.get("SHELL", "")
     if "zsh" in shell:
-        return [".zshrc", ".zprofile"]
+        return (".zshrc", ".zprofile")
     if "bash" in shell:
         if platform.system() == "Darwin":
-            return [".zprofile", ".bash_profile", ".bashrc"]
-        return [".bashrc", ".bash_profile"]
-    return [".zshrc", ".bashrc", ".profile"]
+            return (".zprofile", ".bash_profile", ".bashrc")
+        return (".bashrc", ".bash_profile")
+    return (".zshrc", ".bashrc", ".profile")
 
 
+@lru_cache(maxsize=1)
 def _primary_shell_rc() -> Path | None:
     """Return the primary shell RC file path."""
     candidates = _shell_rc_candidates()
@@ -12,10 +12,11 @@ All model access goes through OpenRouter as the transport layer.
 from __future__ import annotations
 
 import asyncio
-import json
 import os
 
 import click
+import httpx
+import orjson
 
 # Ensure minimal env so pydantic-settings doesn't blow up for CLI usage.
 os.environ.setdefault("DATABASE_URL", "sqlite:///unused.db")
@@ -32,6 +33,8 @@ from app.cli.config import (  # noqa: E402
     save_config,
 )
 from app.cli import output as out  # noqa: E402
+from app.cli.conversation import TokenTracker, count_tokens  # noqa: E402
+from app.cli.transport import aclose_client, get_client, iter_sse_data  # noqa: E402
 
 
 # ---------------------------------------------------------------------------
@@ -40,8 +43,6 @@ from app.cli import output as out  # noqa: E402
 
 async def _oneshot(api_key: str, model: str, prompt: str) -> None:
     """Run a single prompt through OpenRouter and stream to the terminal."""
-    import httpx
-
     # 1. Reasoning Phase
     reasoning = out.ReasoningDisplay()
     reasoning.start(f"Analyzing with {model}...")
@@ -64,52 +65,50 @@ async def _oneshot(api_key: str, model: str, prompt: str) -> None:
     input_tokens = 0
     output_tokens = 0
 
+    # Pre-bind names used on every SSE event to keep attribute lookups
+    # out of the per-token loop.
+    _json_loads = orjson.loads
+    _display_token = display.token
+
     try:
         tokens_started = False
-        async with httpx.AsyncClient(timeout=120.0) as client:
-            async with client.stream(
-                "POST",
-                f"{OPENROUTER_BASE_URL}/chat/completions",
-                headers=headers,
-                json=body,
-            ) as response:
-                response.raise_for_status()
-                async for line in response.aiter_lines():
-                    if not line or not line.startswith("data:"):
-                        continue
-                    payload = line[len("data:"):].strip()
-                    if payload == "[DONE]":
-                        break
-                    try:
-                        event = json.loads(payload)
-                    except json.JSONDecodeError:
-                        continue
-
-                    if not tokens_started:
-                        reasoning.stop()
-                        display.start()
-                        tokens_started = True
-
-                    choices = event.get("choices", [])
-                    if choices:
-                        delta = choices[0].get("delta", {})
-                        text = delta.get("content")
-                        if text:
-                            display.token(text)
-
-                    usage = event.get("usage")
-                    if usage:
-                        input_tokens = usage.get("prompt_tokens", 0)
-                        output_tokens = usage.get("completion_tokens", 0)
+        client = get_client()
+        async with client.stream(
+            "POST",
+            f"{OPENROUTER_BASE_URL}/chat/completions",
+            headers=headers,
+            content=orjson.dumps(body),
+        ) as response:
+            response.raise_for_status()
+            async for payload in iter_sse_data(response):
+                try:
+                    event = _json_loads(payload)
+                except orjson.JSONDecodeError:
+                    continue
+
+                if not tokens_started:
+                    reasoning.stop()
+                    display.start()
+                    tokens_started = True
+
+                choices = event.get("choices")
+                if choices:
+                    text = choices[0].get("delta", {}).get("content")
+                    if text:
+                        _display_token(text)
+
+                usage = event.get("usage")
+                if usage:
+                    input_tokens = usage.get("prompt_tokens", 0)
+                    output_tokens = usage.get("completion_tokens", 0)
 
         display.finish()
 
         # Estimate if API didn't return usage
         result = display.text
         if not output_tokens:
-            output_tokens = max(1, len(result) // 4)
+            output_tokens = max(1, await asyncio.to_thread(count_tokens, result))
 
-        from app.cli.conversation import TokenTracker
         cost = TokenTracker.estimate_cost(input_tokens, output_tokens, model)
 
         out.print_response_footer(
@@ -120,8 +119,11 @@ async def _oneshot(api_key: str, model: str, prompt: str) -> None:
         )
 
         # Auto-save
-        path = out.save_result("ask", f"# Ask ({model})\n\n**Prompt:** {prompt}\n\n{result}")
-        out.print_saved(path)
+        path = await out.save_result(
+            "ask", f"# Ask ({model})\n\n**Prompt:** {prompt}\n\n{result}"
+        )
+        if path is not None:
+            out.print_saved(path)
 
     except httpx.HTTPStatusError as exc:
         display.finish()
@@ -137,6 +139,8 @@ async def _oneshot(api_key: str, model: str, prompt: str) -> None:
     except Exception as exc:  # noqa: BLE001
         display.finish()
         out.print_error(f"Request failed: {exc}")
+    finally:
+        await aclose_client()
 
 
 # ---------------------------------------------------------------------------
@@ -381,37 +385,46 @@ def run(task: str, crew: str, model: str | None, api_key: str | None, budget: fl
 
     Example: code-swap run "Implement JWT auth" --crew full-stack
     """
-    api_key_resolved = resolve_api_key(api_key)
+    from app.cli.crew import CrewConfig, ensure_default_crews, load_crew
 
-    from app.cli.crew import load_crew, ensure_default_crews
-    from app.cli.engine import CrewEngine
-    from app.cli.crew_display import CrewDisplay
+    def _prepare_crew() -> CrewConfig:
+        ensure_default_crews()
+        return load_crew(crew)
 
-    ensure_default_crews()
+    async def _run():
+        # Resolve the key first: it may exit, which would orphan crew_task.
+        api_key_resolved = resolve_api_key(api_key)
 
-    try:
-        crew_config = load_crew(crew)
-    except Exception as exc:
-        out.print_error(f"Failed to load crew '{crew}': {exc}")
-        raise SystemExit(1)
+        # Read and parse the crew YAML on a worker thread while the
+        # engine/display modules are imported.
+        crew_task = asyncio.create_task(asyncio.to_thread(_prepare_crew))
 
-    crew_config.budget_limit_usd = budget
+        from app.cli.engine import CrewEngine
+        from app.cli.crew_display import CrewDisplay, EventStream
 
-    out.print_banner(model=crew_config.orchestrator, key_set=True)
-    out.console.print(f"[muted]Running crew: {crew_config.name} ({len(crew_config.agents)} agents)[/]")
-    out.console.print(f"[muted]Task: {task}[/]")
-    out.console.print()
+        try:
+            crew_config = await crew_task
+        except Exception as exc:
+            out.print_error(f"Failed to load crew '{crew}': {exc}")
+            raise SystemExit(1)
 
-    async def _run():
-        queue: asyncio.Queue = asyncio.Queue()
+        crew_config.budget_limit_usd = budget
+
+        out.print_banner(model=crew_config.orchestrator, key_set=True)
+        out.console.print(f"[muted]Running crew: {crew_config.name} ({len(crew_config.agents)} agents)[/]")
+        out.console.print(f"[muted]Task: {task}[/]")
+        out.console.print()
+
+        events = EventStream()
 
         async def on_event(event: dict):
-            await queue.put(event)
+            events.push(event)
 
         engine = CrewEngine(
             api_key=api_key_resolved,
             crew=crew_config,
             on_event=on_event,
+            client=get_client(),
         )
 
         display = CrewDisplay(
@@ -421,9 +434,12 @@ def run(task: str, crew: str, model: str | None, api_key: str | None, budget: fl
         )
 
         # Run engine and display concurrently
-        engine_task = asyncio.create_task(engine.execute(task))
-        await display.run(queue)
-        result = await engine_task
+        try:
+            engine_task = asyncio.create_task(engine.execute(task))
+            await display.run(events)
+            result = await engine_task
+        finally:
+            await aclose_client()
 
         return result
 
@@ -12,20 +12,26 @@ Devs want tight feedback loops and zero visual noise — not ASCII art banners.
 
 from __future__ import annotations
 
+import asyncio
+import re
 import sys
 import time
-from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple
 
-from rich.columns import Columns
-from rich.console import Console
-from rich.live import Live
-from rich.markdown import Markdown
-from rich.panel import Panel
-from rich.spinner import Spinner
+from rich.console import Console, ConsoleOptions, RenderResult
+from rich.segment import Segment
 from rich.text import Text
 from rich.theme import Theme
 
+# Live, Markdown, Panel, Spinner and Table pull in markdown-it, pygments and
+# the live-render machinery; they are imported where first used so that
+# plain CLI startup does not pay for them.
+if TYPE_CHECKING:
+    from markdown_it import MarkdownIt
+    from rich.live import Live
+
 # ---------------------------------------------------------------------------
 # Theme — muted palette, information density over decoration
 # ---------------------------------------------------------------------------
@@ -68,26 +74,36 @@ RESULTS_DIR = Path("results")
 # ---------------------------------------------------------------------------
 
 
+_BANNER_HEADLINE = Text.from_markup(
+    f"  [accent]code-swap[/] [muted]v{VERSION}[/]"
+    f"  [muted]\u2500[/]  "
+    f"[muted]one key, every model[/]  [muted]\u2500[/]  "
+    f"[muted]openrouter.ai[/]"
+)
+_BANNER_KEY_SET = Text("\u25cf", style="success")
+_BANNER_KEY_UNSET = Text("\u25cb", style="error")
+_BANNER_HINTS = Text("  /help  /compare  /model", style="muted")
+
+
 def print_banner(model: str = "", key_set: bool = False) -> None:
     """Print a minimal startup banner.
 
     Design: 4 lines max.  Shows the value prop (one key, all models)
     and current state.  Does NOT take over the viewport.
     """
-    key_dot = "[success]\u25cf[/]" if key_set else "[error]\u25cb[/]"
     short = model.split("/", 1)[-1] if "/" in model else model
 
     console.print()
-    console.print(
-        f"  [accent]code-swap[/] [muted]v{VERSION}[/]"
-        f"  [muted]\u2500[/]  "
-        f"[muted]one key, every model[/]  [muted]\u2500[/]  "
-        f"[muted]openrouter.ai[/]"
-    )
+    console.print(_BANNER_HEADLINE)
     if model:
         console.print(
-            f"  [prompt.model]{short}[/]  {key_dot}"
-            f"  [muted]/help  /compare  /model[/]"
+            Text.assemble(
+                "  ",
+                (short, "prompt.model"),
+                "  ",
+                _BANNER_KEY_SET if key_set else _BANNER_KEY_UNSET,
+                _BANNER_HINTS,
+            )
         )
     console.print()
 
@@ -96,6 +112,8 @@ def print_banner(model: str = "", key_set: bool = False) -> None:
 # Response header / footer
 # ---------------------------------------------------------------------------
 
+_SEP = "  "
+
 
 def print_response_header(model: str) -> None:
     """Print a model indicator before the response body."""
@@ -110,88 +128,211 @@ def print_response_footer(
     elapsed: float = 0.0,
 ) -> None:
     """Print token stats and timing after a response."""
-    parts: list[str] = []
+    if input_tokens and output_tokens and cost > 0 and elapsed > 0:
+        # Common case: every field present, so skip the per-field branching.
+        console.print()
+        console.print(
+            Text.assemble(
+                f"\u25b2 {input_tokens:,}{_SEP}\u25bc {output_tokens:,}{_SEP}",
+                (f"${cost:.4f}", "cost"),
+                f"{_SEP}{elapsed:.1f}s",
+                style="stat",
+            )
+        )
+        console.print()
+        return
+
+    line = Text(style="stat")
 
     if input_tokens:
-        parts.append(f"\u25b2 {input_tokens:,}")
+        line.append(f"\u25b2 {input_tokens:,}")
     if output_tokens:
-        parts.append(f"\u25bc {output_tokens:,}")
+        if line:
+            line.append(_SEP)
+        line.append(f"\u25bc {output_tokens:,}")
     if cost > 0:
-        parts.append(f"[cost]${cost:.4f}[/]")
+        if line:
+            line.append(_SEP)
+        line.append(f"${cost:.4f}", style="cost")
     if elapsed > 0:
-        parts.append(f"{elapsed:.1f}s")
+        if line:
+            line.append(_SEP)
+        line.append(f"{elapsed:.1f}s")
 
     console.print()
-    if parts:
-        console.print(f"[stat]{_SEP.join(parts)}[/]")
+    if line:
+        console.print(line)
     console.print()
 
 
-_SEP = "  "
-
-
 # ---------------------------------------------------------------------------
 # Streaming display
 # ---------------------------------------------------------------------------
 
 
+# A fence opener or closer: up to three spaces, then three or more ` or ~.
+_FENCE_RE = re.compile(r" {0,3}(`{3,}|~{3,})")
+# A line that could continue an open list rather than start a new block.
+_LIST_ITEM_RE = re.compile(r"(?:\d{1,9}[.)]|[-*+])(?:[ \t]|$)")
+
+
+@lru_cache(maxsize=1)
+def _markdown_parser() -> MarkdownIt:
+    """Return a markdown-it parser configured the way ``rich.markdown`` builds its own."""
+    from markdown_it import MarkdownIt
+
+    return MarkdownIt().enable("strikethrough").enable("table")
+
+
+class _RenderedBlock(NamedTuple):
+    """A committed Markdown block and how it joins its neighbours."""
+
+    output: str
+    # Rich separates top-level blocks with a blank line that depends on both
+    # sides: the previous element's ``new_line`` flag (False after a rule)
+    # and whether the next one is a leaf. Containers (lists, quotes, tables)
+    # already emit their own leading blank line.
+    starts_with_leaf: bool
+    ends_with_new_line: bool
+
+
 class StreamingDisplay:
     """Accumulates streaming tokens and renders the final result as Markdown.
 
     A spinner shows "Thinking..." until the first token arrives.
     Raw tokens stream directly for minimum latency.
     On finish, raw text is erased and re-rendered as Rich Markdown.
+
+    Completed top-level Markdown blocks are rendered to terminal output as
+    soon as markdown-it confirms they closed, so ``finish()`` only has to
+    parse and render the pending tail. Lists are never split: a list stays
+    pending until a block that is not part of it begins.
+
+    Raw writes are coalesced: tokens are flushed to the terminal at most
+    once per ``_FLUSH_INTERVAL`` seconds or once ``_FLUSH_BYTES`` characters
+    are queued, whichever comes first. A token arriving after a quiet spell
+    is written at once, and when called from a running event loop a timer
+    flushes whatever is still queued if the stream pauses.
     """
 
+    _FLUSH_INTERVAL: float = 0.016  # ~60 Hz
+    _FLUSH_BYTES: int = 512
+
     def __init__(self, target_console: Console | None = None) -> None:
         self._console = target_console or console
         self._buffer: list[str] = []
         self._start: float = 0.0
         self._lines_written: int = 0
+        self._line_widths: list[int] = [0]
+        self._rows_width: int = 80
+        self._closed_rows: int = 0
+        self._cached_text: str | None = None
         self._live: Live | None = None
         self._spinner_active: bool = False
+        self._committed: list[tuple[str, _RenderedBlock]] = []
+        self._committed_width: int = 0
+        self._pending: str = ""
+        self._scan_pos: int = 0
+        self._open_fence: str | None = None
+        self._after_blank: bool = False
+        self._pending_out: list[str] = []
+        self._pending_out_len: int = 0
+        self._last_flush: float = 0.0
+        self._flush_timer: asyncio.TimerHandle | None = None
+        # Raw tokens bypass the TextIOWrapper and go straight to the byte
+        # stream when there is one (not the case for e.g. a StringIO).
+        self._stdout = sys.stdout
+        self._out = getattr(sys.stdout, "buffer", None)
+        self._encoding = getattr(sys.stdout, "encoding", None) or "utf-8"
 
     # -- public API ---------------------------------------------------------
 
     def start(self) -> None:
         """Mark the beginning of a streaming response and show spinner."""
-        self._buffer.clear()
-        self._lines_written = 0
-        self._start = time.monotonic()
+        self.reset()
+
+        from rich.live import Live
+        from rich.spinner import Spinner
 
         spinner = Spinner("dots", text="[muted]Thinking...[/]", style="info")
         self._live = Live(spinner, console=self._console, transient=True)
         self._live.start()
         self._spinner_active = True
 
+    def reset(self) -> None:
+        """Drop all per-response state so the display can be reused."""
+        self._buffer.clear()
+        self._lines_written = 0
+        self._line_widths = [0]
+        self._rows_width = self._terminal_width()
+        self._closed_rows = 0
+        self._cached_text = None
+        self._committed.clear()
+        self._pending = ""
+        self._scan_pos = 0
+        self._open_fence = None
+        self._after_blank = False
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        self._pending_out.clear()
+        self._pending_out_len = 0
+        self._start = time.monotonic()
+        self._last_flush = 0.0
+
     def token(self, text: str) -> None:
         """Append a single token to the stream and print it raw."""
         if self._spinner_active:
             self._stop_spinner()
 
         self._buffer.append(text)
-        sys.stdout.write(text)
-        sys.stdout.flush()
-        self._lines_written += text.count("\n")
+        self._pending_out.append(text)
+        self._pending_out_len += len(text)
+        wait = self._FLUSH_INTERVAL - (time.monotonic() - self._last_flush)
+        if wait <= 0 or self._pending_out_len >= self._FLUSH_BYTES:
+            self._drain()
+        elif self._flush_timer is None:
+            self._schedule_drain(wait)
+
+        self._cached_text = None
+        if "\n" in text:
+            lines = text.split("\n")
+            widths = self._line_widths
+            tw = self._rows_width
+            widths[-1] += len(lines[0])
+            # Every line but the new last one is now closed; count its rows.
+            for width in widths[-1:] + [len(line) for line in lines[1:-1]]:
+                self._closed_rows += max(1, -(-width // tw))
+            widths.extend(map(len, lines[1:]))
+            self._lines_written += len(lines) - 1
+        else:
+            self._line_widths[-1] += len(text)
+
+        self._pending += text
+        if "\n" in text:
+            self._scan_lines()
 
     def finish(self) -> None:
         """Replace the raw streamed text with a formatted Markdown render."""
         if self._spinner_active:
             self._stop_spinner()
+        self._drain()
 
         raw = self.text
         if not raw.strip():
-            sys.stdout.write("\n")
-            sys.stdout.flush()
+            self._write("\n")
             return
 
-        self._erase_streamed_output(raw)
-        self._console.print(Markdown(raw))
+        # The erase sequence and the formatted output reach the terminal in
+        # a single write.
+        self._write(self._erase_streamed_output() + self._rendered_output())
 
     @property
     def text(self) -> str:
         """Return the full accumulated response text."""
-        return "".join(self._buffer)
+        if self._cached_text is None:
+            self._cached_text = "".join(self._buffer)
+        return self._cached_text
 
     @property
     def elapsed(self) -> float:
@@ -208,25 +349,169 @@ class StreamingDisplay:
             self._live.stop()
             self._live = None
         self._spinner_active = False
+        self._drain()
 
-    def _erase_streamed_output(self, raw: str) -> None:
-        """Move the cursor up and clear the lines occupied by the raw stream."""
-        if not sys.stdout.isatty():
-            sys.stdout.write("\n")
-            sys.stdout.flush()
+    def _schedule_drain(self, delay: float) -> None:
+        """Drain after *delay* seconds so queued text is not held during a pause."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No loop to wake us later: write now rather than risk holding text.
+            self._drain()
             return
+        self._flush_timer = loop.call_later(delay, self._drain)
+
+    def _drain(self) -> None:
+        """Write and flush any queued raw tokens."""
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        if self._pending_out:
+            self._write("".join(self._pending_out))
+            self._pending_out.clear()
+            self._pending_out_len = 0
+        self._last_flush = time.monotonic()
+
+    def _scan_lines(self) -> None:
+        """Track fences and blank lines over newly completed lines of the pending tail.
+
+        A commit is only attempted when a non-indented line that cannot
+        continue a list follows a blank line outside any code fence; each
+        line is scanned once, so a long fence or list costs linear time.
+        """
+        pending = self._pending
+        pos = self._scan_pos
+        while (end := pending.find("\n", pos)) != -1:
+            line = pending[pos:end]
+            line_start = pos
+            pos = end + 1
+
+            fence = _FENCE_RE.match(line)
+            if self._open_fence is not None:
+                if fence and fence.group(1).startswith(self._open_fence) and (
+                    not line[fence.end() :].strip()
+                ):
+                    self._open_fence = None
+                continue
+
+            if not line.strip():
+                self._after_blank = True
+                continue
+            after_blank, self._after_blank = self._after_blank, False
+            if (
+                after_blank
+                and not line[0].isspace()
+                and not _LIST_ITEM_RE.match(line)
+                and self._commit_blocks(line_start)
+            ):
+                # The tail was cut; rescan what is left of it.
+                pending = self._pending
+                pos = 0
+                continue
+            if fence:
+                self._open_fence = fence.group(1)
+        self._scan_pos = pos
+
+    def _commit_blocks(self, boundary: int) -> bool:
+        """Render every top-level block that closed before *boundary*.
+
+        markdown-it parses the tail up to the end of the line that starts at
+        *boundary*; every top-level block except the last is complete. Returns
+        ``True`` if the pending tail was cut.
+        """
+        end = self._pending.find("\n", boundary)
+        source = self._pending[: end + 1]
+        starts = [
+            tok.map[0]
+            for tok in _markdown_parser().parse(source)
+            if tok.level == 0 and tok.nesting >= 0 and tok.map is not None
+        ]
+        if len(starts) < 2:
+            return False
+
+        lines = source.splitlines(keepends=True)
+        cut = sum(map(len, lines[: starts[-1]]))
+        head = self._pending[:cut]
+        self._sync_width()
+        if head.strip():
+            self._committed.append((head, self._render_block(head)))
+        self._pending = self._pending[cut:]
+        self._open_fence = None
+        self._after_blank = False
+        return True
+
+    def _sync_width(self) -> None:
+        """Re-render committed blocks if the terminal was resized since."""
+        width = self._console.width
+        if width != self._committed_width:
+            self._committed = [(src, self._render_block(src)) for src, _ in self._committed]
+            self._committed_width = width
+
+    def _render_block(self, source: str) -> _RenderedBlock:
+        """Render one run of Markdown blocks to terminal output."""
+        from rich.markdown import Markdown, UnknownElement
+
+        markdown = Markdown(source)
+        tokens = markdown.parsed
+        top = [i for i, tok in enumerate(tokens) if tok.level == 0 and tok.nesting >= 0]
+        with self._console.capture() as capture:
+            self._console.print(markdown, end="")
+        if not top:
+            return _RenderedBlock(capture.get(), False, False)
+
+        first = top[0]
+        last_type = tokens[top[-1]].type
+        starts_with_leaf = tokens[first].nesting == 0 or (
+            first + 1 < len(tokens) and tokens[first + 1].type == "inline"
+        )
+        element = Markdown.elements.get(last_type, UnknownElement)
+        return _RenderedBlock(capture.get(), starts_with_leaf, element.new_line)
+
+    def _rendered_output(self) -> str:
+        """Join committed blocks and the freshly rendered tail the way Rich spaces them."""
+        self._sync_width()
+        blocks = [rendered for _, rendered in self._committed]
+        if self._pending.strip():
+            blocks.append(self._render_block(self._pending))
+        parts: list[str] = []
+        prev: _RenderedBlock | None = None
+        for block in blocks:
+            if prev is not None and prev.ends_with_new_line and block.starts_with_leaf:
+                parts.append("\n")
+            parts.append(block.output)
+            prev = block
+        return "".join(parts)
+
+    def _write(self, data: str) -> None:
+        """Write *data* to stdout and flush, via the byte stream if available."""
+        if self._out is None:
+            self._stdout.write(data)
+            self._stdout.flush()
+            return
+        # Anything Rich wrote through the text layer must land first.
+        self._stdout.flush()
+        self._out.write(data.encode(self._encoding, "replace"))
+        self._out.flush()
 
+    def _terminal_width(self) -> int:
         try:
-            term_width = self._console.width or 80
+            return self._console.width or 80
         except Exception:
-            term_width = 80
+            return 80
+
+    def _erase_streamed_output(self) -> str:
+        """Return the escape sequence that clears the lines of the raw stream."""
+        if not self._stdout.isatty():
+            return "\n"
 
-        line_count = 0
-        for line in raw.split("\n"):
-            line_count += max(1, -(-len(line) // term_width))
+        term_width = self._terminal_width()
+        if term_width == self._rows_width:
+            line_count = self._closed_rows + max(1, -(-self._line_widths[-1] // term_width))
+        else:
+            # Resized mid-stream: the running total is for the old width.
+            line_count = sum(max(1, -(-width // term_width)) for width in self._line_widths)
 
-        sys.stdout.write(f"\r\033[{line_count}A\033[J")
-        sys.stdout.flush()
+        return f"\r\033[{line_count}A\033[J"
 
 
 # ---------------------------------------------------------------------------
@@ -234,6 +519,28 @@ class StreamingDisplay:
 # ---------------------------------------------------------------------------
 
 
+@lru_cache(maxsize=64)
+def _render_markdown_cached(text: str, width: int) -> tuple[Segment, ...]:
+    """Render *text* as Markdown at *width* columns, memoized."""
+    from rich.markdown import Markdown
+
+    return tuple(console.render(Markdown(text), console.options.update(width=width)))
+
+
+class _CachedMarkdown:
+    """Markdown renderable that replays a cached render for its layout width.
+
+    Re-printing the same compare panels is then a cache hit; a resized
+    terminal yields a new width and therefore a fresh render.
+    """
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+
+    def __rich_console__(self, console: Console, options: ConsoleOptions) -> RenderResult:
+        yield from _render_markdown_cached(self.text, options.max_width)
+
+
 def print_side_by_side(
     left_title: str,
     left_text: str,
@@ -241,11 +548,14 @@ def print_side_by_side(
     right_text: str,
 ) -> None:
     """Render two responses as side-by-side Rich panels."""
-    left_body: Markdown | Text = (
-        Markdown(left_text) if left_text.strip() else Text("[no response]", style="muted")
+    from rich.panel import Panel
+    from rich.table import Table
+
+    left_body: _CachedMarkdown | Text = (
+        _CachedMarkdown(left_text) if left_text.strip() else Text("[no response]", style="muted")
     )
-    right_body: Markdown | Text = (
-        Markdown(right_text) if right_text.strip() else Text("[no response]", style="muted")
+    right_body: _CachedMarkdown | Text = (
+        _CachedMarkdown(right_text) if right_text.strip() else Text("[no response]", style="muted")
     )
 
     left_panel = Panel(
@@ -263,8 +573,15 @@ def print_side_by_side(
         padding=(1, 2),
     )
 
+    # Equal-ratio grid columns give a fixed 50/50 split without a
+    # per-renderable measuring pass.
+    grid = Table.grid(expand=True, padding=(0, 1))
+    grid.add_column(ratio=1)
+    grid.add_column(ratio=1)
+    grid.add_row(left_panel, right_panel)
+
     console.print()
-    console.print(Columns([left_panel, right_panel], equal=True, expand=True))
+    console.print(grid)
 
 
 # ---------------------------------------------------------------------------
@@ -272,17 +589,27 @@ def print_side_by_side(
 # ---------------------------------------------------------------------------
 
 
+# Styles resolved once from the theme; the helpers below build Text directly
+# instead of going through the markup parser on every call.
+_ERROR_STYLE = console.get_style("error")
+_ERROR_DETAIL_STYLE = console.get_style("error.detail")
+_WARNING_STYLE = console.get_style("warning")
+_SUCCESS_STYLE = console.get_style("success")
+_INFO_STYLE = console.get_style("info")
+_MUTED_STYLE = console.get_style("muted")
+
+
 def print_error(
     title: str,
     detail: str | None = None,
     suggestion: str | None = None,
 ) -> None:
     """Print a structured, actionable error message."""
-    console.print(f"[error]\u2718 {title}[/]")
+    console.print(Text(f"\u2718 {title}", style=_ERROR_STYLE))
     if detail:
-        console.print(f"  [error.detail]{detail}[/]")
+        console.print(Text.assemble("  ", (detail, _ERROR_DETAIL_STYLE)))
     if suggestion:
-        console.print(f"  [muted]\u2192 {suggestion}[/]")
+        console.print(Text.assemble("  ", (f"\u2192 {suggestion}", _MUTED_STYLE)))
 
 
 def print_warning(
@@ -290,19 +617,19 @@ def print_warning(
     detail: str | None = None,
 ) -> None:
     """Print a warning message."""
-    console.print(f"[warning]\u26a0 {title}[/]")
+    console.print(Text(f"\u26a0 {title}", style=_WARNING_STYLE))
     if detail:
-        console.print(f"  [muted]{detail}[/]")
+        console.print(Text.assemble("  ", (detail, _MUTED_STYLE)))
 
 
 def print_success(message: str) -> None:
     """Print a success message."""
-    console.print(f"[success]{message}[/]")
+    console.print(Text(message, style=_SUCCESS_STYLE))
 
 
 def print_info(message: str) -> None:
     """Print an informational message."""
-    console.print(f"[info]{message}[/]")
+    console.print(Text(message, style=_INFO_STYLE))
 
 
 # ---------------------------------------------------------------------------
@@ -310,15 +637,27 @@ def print_info(message: str) -> None:
 # ---------------------------------------------------------------------------
 
 
-def save_result(label: str, content: str) -> Path:
-    """Save output to ``results/`` with a timestamp. Returns the file path."""
-    RESULTS_DIR.mkdir(parents=True, exist_ok=True)
-    ts = datetime.now().strftime("%Y-%m-%d_%H%M%S")
+async def save_result(label: str, content: str) -> Path | None:
+    """Save output to ``results/`` with a timestamp. Returns the file path.
+
+    The write runs in a worker thread so a slow disk never blocks the event
+    loop. Returns ``None`` after warning if the file could not be written.
+    """
+    ts = time.strftime("%Y-%m-%d_%H%M%S")
     path = RESULTS_DIR / f"{ts}_{label}.md"
-    path.write_text(content, encoding="utf-8")
+    try:
+        await asyncio.to_thread(_write_result, path, content)
+    except OSError as exc:
+        print_warning(f"Failed to save {path}", detail=str(exc))
+        return None
     return path
 
 
+def _write_result(path: Path, content: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(content.encode("utf-8"))
+
+
 def print_saved(path: Path) -> None:
     """Show where a result was saved."""
     console.print(f"[muted]Saved to {path}[/]")
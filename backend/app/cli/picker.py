@@ -6,8 +6,18 @@ popular models surfaced first, grouped by provider.
 
 from __future__ import annotations
 
-import httpx
-from InquirerPy import inquirer
+import hashlib
+import time
+from functools import lru_cache
+from operator import itemgetter
+from pathlib import Path
+from typing import Any
+
+import orjson
+
+from app.cli.transport import create_client
+
+__all__ = ["POPULAR_MODEL_IDS", "fetch_models", "pick_model", "pick_model_async"]
 
 POPULAR_MODEL_IDS: list[str] = [
     "anthropic/claude-opus-4.6",
@@ -30,11 +40,23 @@ POPULAR_MODEL_IDS: list[str] = [
     "mistralai/mistral-medium-3.1",
 ]
 
-_POPULAR_SET = set(POPULAR_MODEL_IDS)
+_POPULAR_SET = frozenset(POPULAR_MODEL_IDS)
 
 _POPULAR_RANK = {model_id: i for i, model_id in enumerate(POPULAR_MODEL_IDS)}
 
+_SORT_KEY = itemgetter("_sort_key")
+
+MODELS_URL = "https://openrouter.ai/api/v1/models"
+
+# Catalog responses are cached per API key; within the TTL the network is
+# skipped entirely, after it a conditional GET revalidates via ETag.
+MODELS_CACHE_DIR: Path = Path.home() / ".code_swap" / "cache"
+MODELS_CACHE_TTL: float = 3600.0
+
 
+# Catalog prices and context sizes fall into a handful of tiers, so the
+# formatted strings are memoized.
+@lru_cache(maxsize=256)
 def _format_price(price_per_token: str) -> str:
     val = float(price_per_token)
     if val == 0:
@@ -45,6 +67,7 @@ def _format_price(price_per_token: str) -> str:
     return f"${per_million:.2f}/M"
 
 
+@lru_cache(maxsize=256)
 def _format_context(ctx: int) -> str:
     if ctx >= 1_000_000:
         return f"{ctx // 1_000_000}M"
@@ -53,21 +76,46 @@ def _format_context(ctx: int) -> str:
     return str(ctx)
 
 
-async def fetch_models(api_key: str) -> list[dict]:
+async def fetch_models(api_key: str, force_refresh: bool = False) -> list[dict]:
     """Fetch models from OpenRouter.
 
     Returns a list sorted with popular models first, then the rest
-    alphabetically.
+    alphabetically. Served from the on-disk cache when it is fresh or when
+    OpenRouter answers ``304 Not Modified``. *force_refresh* skips the
+    freshness check and always revalidates with the server.
     """
-    async with httpx.AsyncClient() as client:
-        resp = await client.get(
-            "https://openrouter.ai/api/v1/models",
-            headers={"Authorization": f"Bearer {api_key}"},
-        )
-        resp.raise_for_status()
+    cache_path = _cache_path(api_key)
+    cached = _read_cache(cache_path)
+    if (
+        not force_refresh
+        and cached is not None
+        and time.time() - cached["fetched_at"] < MODELS_CACHE_TTL
+    ):
+        return cached["models"]
+
+    headers = {"Authorization": f"Bearer {api_key}"}
+    if cached is not None and cached.get("etag"):
+        headers["If-None-Match"] = cached["etag"]
+
+    async with create_client() as client:
+        resp = await client.get(MODELS_URL, headers=headers)
+
+    if resp.status_code == 304 and cached is not None:
+        cached["fetched_at"] = time.time()
+        _write_cache(cache_path, cached)
+        return cached["models"]
+    resp.raise_for_status()
+
+    models = _build_models(orjson.loads(resp.content)["data"])
+    _write_cache(
+        cache_path,
+        {"etag": resp.headers.get("etag"), "fetched_at": time.time(), "models": models},
+    )
+    return models
 
-    data: list[dict] = resp.json()["data"]
 
+def _build_models(data: list[dict]) -> list[dict]:
+    """Normalise raw catalog entries, sort them and attach picker labels."""
     models = [
         {
             "id": m["id"],
@@ -82,15 +130,60 @@ async def fetch_models(api_key: str) -> list[dict]:
         for m in data
     ]
 
-    def sort_key(m: dict) -> tuple[int, int, str]:
-        if m["is_popular"]:
-            return (0, _POPULAR_RANK.get(m["id"], 999), m["id"])
-        return (1, 0, m["id"])
+    # Sort on a precomputed tuple column so the key is a C-level itemgetter
+    # rather than a Python closure per element.
+    for m in models:
+        mid = m["id"]
+        m["_sort_key"] = (
+            (0, _POPULAR_RANK.get(mid, 999), mid) if m["is_popular"] else (1, 0, mid)
+        )
+    models.sort(key=_SORT_KEY)
+
+    # Precompute picker labels once so reopening /model is a plain list walk.
+    # The sort key is dropped so cached and fresh catalogs compare equal.
+    for m in models:
+        del m["_sort_key"]
+        marker = "\u2605 " if m["is_popular"] else "  "
+        ctx = _format_context(m["context_length"])
+        prompt_price = _format_price(m["pricing"]["prompt"])
+        m["_label"] = f"{marker}{m['id']}  ({ctx} ctx, {prompt_price})"
 
-    models.sort(key=sort_key)
     return models
 
 
+# ---------------------------------------------------------------------------
+# Catalog cache
+# ---------------------------------------------------------------------------
+
+
+def _cache_path(api_key: str) -> Path:
+    digest = hashlib.sha1(api_key.encode()).hexdigest()[:8]
+    return MODELS_CACHE_DIR / f"models_{digest}.json"
+
+
+def _read_cache(path: Path) -> dict[str, Any] | None:
+    """Return the cached catalog payload, or ``None`` if missing or unreadable."""
+    try:
+        payload = orjson.loads(path.read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        return None
+    if not isinstance(payload, dict) or not isinstance(payload.get("models"), list):
+        return None
+    payload.setdefault("fetched_at", 0.0)
+    return payload
+
+
+def _write_cache(path: Path, payload: dict[str, Any]) -> None:
+    """Atomically persist *payload*; a failed write only costs a refetch."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_bytes(orjson.dumps(payload))
+        tmp.replace(path)
+    except OSError:
+        pass
+
+
 def _build_picker(models: list[dict], current_model: str | None):
     """Build the InquirerPy fuzzy selector with popular models first."""
     choices = []
@@ -98,22 +191,17 @@ def _build_picker(models: list[dict], current_model: str | None):
     seen_other = False
 
     for m in models:
-        ctx = _format_context(m.get("context_length", 0))
-        prompt_price = _format_price(m.get("pricing", {}).get("prompt", "0"))
-
-        if m.get("is_popular"):
-            label = f"\u2605 {m['id']}  ({ctx} ctx, {prompt_price})"
-        else:
-            if not seen_other:
-                choices.append({"name": "\u2500\u2500\u2500 all models \u2500\u2500\u2500", "value": None})
-                seen_other = True
-            label = f"  {m['id']}  ({ctx} ctx, {prompt_price})"
+        label = m["_label"]
+        if not seen_other and not m["is_popular"]:
+            choices.append({"name": "\u2500\u2500\u2500 all models \u2500\u2500\u2500", "value": None})
+            seen_other = True
 
         choices.append({"name": label, "value": m["id"]})
 
         if current_model and m["id"] == current_model:
             default = label
 
+    from InquirerPy import inquirer
     from InquirerPy.utils import get_style
 
     custom_style = get_style({
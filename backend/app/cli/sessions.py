@@ -16,12 +16,21 @@ Line 2+ (messages):
 
 from __future__ import annotations
 
-import json
+import atexit
+import io
 import logging
+import os
+import threading
 import uuid
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+import orjson
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
 
 log = logging.getLogger(__name__)
 
@@ -32,6 +41,15 @@ log = logging.getLogger(__name__)
 SESSIONS_DIR: Path = Path.home() / ".code_swap" / "sessions"
 INDEX_PATH: Path = SESSIONS_DIR / "index.json"
 
+# Buffer size of the per-session append writers.
+_APPEND_BUFFER_SIZE = 64 * 1024
+
+# Open flags for appending to an existing session file (never creating it).
+_APPEND_FLAGS = os.O_WRONLY | os.O_APPEND | getattr(os, "O_BINARY", 0)
+
+# Index changes made within this many seconds are written out together.
+_INDEX_FLUSH_DELAY = 0.05
+
 # ---------------------------------------------------------------------------
 # Data structures
 # ---------------------------------------------------------------------------
@@ -72,16 +90,62 @@ def _session_path(session_id: str) -> Path:
     return SESSIONS_DIR / f"{session_id}.jsonl"
 
 
+def _fsync_dir(path: Path) -> None:
+    """Flush a directory entry change (e.g. a rename) to disk; POSIX only."""
+    if os.name != "posix":
+        return
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
 # ---------------------------------------------------------------------------
 # SessionStore
 # ---------------------------------------------------------------------------
 
 
 class SessionStore:
-    """JSONL-based persistent session storage."""
+    """JSONL-based persistent session storage.
+
+    ``index.json`` is read into an in-memory mapping of ``session_id`` to
+    ``SessionMeta``. Later updates edit that mapping and schedule one
+    coalesced, fsynced write-back shortly after; the file is only re-read
+    when its mtime shows another process changed it.
+
+    Appends go through one buffered writer per session that stays open
+    until ``close()``, which also runs at interpreter exit.
+    """
 
     def __init__(self) -> None:
         SESSIONS_DIR.mkdir(parents=True, exist_ok=True)
+        self._index: dict[str, SessionMeta] | None = None
+        # ``st_mtime_ns`` of index.json when last read or written (0: absent).
+        self._index_mtime: int = 0
+        # ``list_sessions`` order, rebuilt lazily after any index change.
+        self._sorted: list[SessionMeta] | None = None
+        # Guards the index against the flush timer thread.
+        self._index_lock = threading.Lock()
+        self._index_dirty: bool = False
+        self._flush_timer: threading.Timer | None = None
+        self._writers: dict[str, io.BufferedWriter] = {}
+        atexit.register(self.close)
+
+    def close(self) -> None:
+        """Write any pending index changes and close every append writer."""
+        timer = self._flush_timer
+        if timer is not None:
+            timer.cancel()
+        self._flush_index()
+
+        writers = self._writers
+        self._writers = {}
+        for session_id, writer in writers.items():
+            try:
+                writer.close()
+            except OSError:
+                log.exception("Failed to flush session %s", session_id)
 
     # -- public API --------------------------------------------------------
 
@@ -139,26 +203,32 @@ class SessionStore:
         # Write JSONL file ------------------------------------------------
         path = _session_path(session_id)
         try:
-            with path.open("w", encoding="utf-8") as fh:
-                # Header line
-                header = {
-                    "type": "header",
-                    "meta": asdict(meta),
-                    "system_prompt": conversation.system_prompt,
-                }
-                fh.write(json.dumps(header, ensure_ascii=False) + "\n")
-
-                # Message lines
-                for msg in messages:
-                    line = {
-                        "type": "message",
-                        "role": msg["role"],
-                        "content": msg["content"],
-                        "timestamp": now,
-                        "input_tokens": 0,
-                        "output_tokens": 0,
-                    }
-                    fh.write(json.dumps(line, ensure_ascii=False) + "\n")
+            # Header line (orjson serializes the dataclass natively)
+            header = {
+                "type": "header",
+                "meta": meta,
+                "system_prompt": conversation.system_prompt,
+            }
+            buf = bytearray(orjson.dumps(header, option=orjson.OPT_APPEND_NEWLINE))
+
+            # Message lines, assembled directly as bytes: only role and
+            # content vary, so no per-message dict is built. The byte layout
+            # matches what orjson emits for the equivalent dict.
+            dumps = orjson.dumps
+            tail = (
+                b',"timestamp":' + dumps(now)
+                + b',"input_tokens":0,"output_tokens":0}\n'
+            )
+            for msg in messages:
+                buf += b'{"type":"message","role":'
+                buf += dumps(msg["role"])
+                buf += b',"content":'
+                buf += dumps(msg["content"])
+                buf += tail
+
+            # The whole file goes out in a single write.
+            with path.open("wb") as fh:
+                fh.write(buf)
         except OSError:
             log.exception("Failed to write session file %s", path)
             raise
@@ -173,36 +243,79 @@ class SessionStore:
         content: str,
         input_tokens: int = 0,
         output_tokens: int = 0,
+        flush: bool = True,
     ) -> None:
         """Append a single message line to an existing session file.
 
         This is the crash-safe incremental path: if the process dies mid-write
         the worst case is one truncated trailing line which ``load_session``
         gracefully skips.
+
+        The line goes to the session's open buffered writer. Pass
+        ``flush=False`` when another append follows shortly (e.g. the user
+        half of a turn) to have both reach the file in one write.
         """
-        path = _session_path(session_id)
-        if not path.exists():
-            log.warning("Session file not found for append: %s", session_id)
-            return
+        writer = self._writers.get(session_id)
+        if writer is None:
+            # Open without O_CREAT so a missing session fails here rather
+            # than being created empty, and without a separate exists() stat.
+            try:
+                fd = os.open(_session_path(session_id), _APPEND_FLAGS)
+            except FileNotFoundError:
+                log.warning("Session file not found for append: %s", session_id)
+                return
+            except OSError:
+                log.exception("Failed to append to session %s", session_id)
+                return
+            try:
+                writer = os.fdopen(fd, "ab", buffering=_APPEND_BUFFER_SIZE)
+            except OSError:
+                os.close(fd)
+                log.exception("Failed to append to session %s", session_id)
+                return
+            self._writers[session_id] = writer
 
+        now = _now_iso()
         line = {
             "type": "message",
             "role": role,
             "content": content,
-            "timestamp": _now_iso(),
+            "timestamp": now,
             "input_tokens": input_tokens,
             "output_tokens": output_tokens,
         }
         try:
-            with path.open("a", encoding="utf-8") as fh:
-                fh.write(json.dumps(line, ensure_ascii=False) + "\n")
+            writer.write(orjson.dumps(line, option=orjson.OPT_APPEND_NEWLINE))
+            if flush:
+                writer.flush()
         except OSError:
             log.exception("Failed to append to session %s", session_id)
             return
 
-        # Refresh index with updated counts.
+        # Bump the indexed counts in place rather than re-reading the file.
+        with self._index_lock:
+            meta = self._load_index().get(session_id)
+            if meta is not None:
+                meta.message_count += 1
+                meta.total_tokens += input_tokens + output_tokens
+                meta.updated_at = now
+                self._mark_index_dirty()
+                return
+        # Not indexed (e.g. index.json was lost): rebuild from the file,
+        # which must include the line just buffered.
+        self.flush(session_id)
         self._refresh_meta_from_file(session_id)
 
+    def flush(self, session_id: str) -> None:
+        """Push any buffered appends for *session_id* to the file."""
+        writer = self._writers.get(session_id)
+        if writer is None:
+            return
+        try:
+            writer.flush()
+        except OSError:
+            log.exception("Failed to flush session %s", session_id)
+
     def load_session(self, session_id: str) -> dict:
         """Read a JSONL session file and return its contents.
 
@@ -210,47 +323,54 @@ class SessionStore:
         -------
         dict
             ``{"meta": SessionMeta, "system_prompt": str, "messages": [dict]}``
+            Every message dict carries ``role`` and ``content`` keys, so the
+            list can be handed straight to ``Conversation.from_serializable``.
 
         Raises
         ------
         FileNotFoundError
             If the session file does not exist.
         """
+        # Lines appended with flush=False would otherwise be missed.
+        self.flush(session_id)
         path = _session_path(session_id)
-        if not path.exists():
-            raise FileNotFoundError(f"Session not found: {session_id}")
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Session not found: {session_id}") from None
 
         meta: SessionMeta | None = None
         system_prompt: str = ""
         messages: list[dict] = []
 
-        with path.open("r", encoding="utf-8") as fh:
-            for lineno, raw_line in enumerate(fh, 1):
-                raw_line = raw_line.strip()
-                if not raw_line:
-                    continue
-                try:
-                    obj = json.loads(raw_line)
-                except json.JSONDecodeError:
-                    log.warning(
-                        "Skipping corrupt line %d in %s", lineno, path.name
-                    )
-                    continue
-
-                if obj.get("type") == "header":
-                    meta_dict = obj.get("meta", {})
-                    meta = SessionMeta(**meta_dict)
-                    system_prompt = obj.get("system_prompt", "")
-                elif obj.get("type") == "message":
-                    messages.append(
-                        {
-                            "role": obj["role"],
-                            "content": obj["content"],
-                            "timestamp": obj.get("timestamp", ""),
-                            "input_tokens": obj.get("input_tokens", 0),
-                            "output_tokens": obj.get("output_tokens", 0),
-                        }
-                    )
+        # One read for the whole file; lines stay bytes so orjson parses
+        # them without a separate decode.
+        for lineno, raw_line in enumerate(data.split(b"\n"), 1):
+            raw_line = raw_line.strip()
+            if not raw_line:
+                continue
+            try:
+                obj = orjson.loads(raw_line)
+            except orjson.JSONDecodeError:
+                log.warning(
+                    "Skipping corrupt line %d in %s", lineno, path.name
+                )
+                continue
+
+            if obj.get("type") == "header":
+                meta_dict = obj.get("meta", {})
+                meta = SessionMeta(**meta_dict)
+                system_prompt = obj.get("system_prompt", "")
+            elif obj.get("type") == "message":
+                messages.append(
+                    {
+                        "role": obj["role"],
+                        "content": obj["content"],
+                        "timestamp": obj.get("timestamp", ""),
+                        "input_tokens": obj.get("input_tokens", 0),
+                        "output_tokens": obj.get("output_tokens", 0),
+                    }
+                )
 
         if meta is None:
             raise ValueError(f"Session file missing header: {session_id}")
@@ -263,15 +383,15 @@ class SessionStore:
 
     def list_sessions(self) -> list[SessionMeta]:
         """Return all sessions sorted by ``updated_at`` descending."""
-        index = self._load_index()
-        sessions = []
-        for entry in index:
-            try:
-                sessions.append(SessionMeta(**entry))
-            except TypeError:
-                log.warning("Skipping malformed index entry: %s", entry)
-        sessions.sort(key=lambda s: s.updated_at, reverse=True)
-        return sessions
+        # Appends run in worker threads; sort and cache under the lock so a
+        # concurrent change cannot be lost behind a stale ``_sorted``.
+        with self._index_lock:
+            index = self._load_index()
+            if self._sorted is None:
+                self._sorted = sorted(
+                    index.values(), key=lambda s: s.updated_at, reverse=True
+                )
+            return list(self._sorted)
 
     def get_latest(self) -> SessionMeta | None:
         """Return the most recently updated session, or *None*."""
@@ -283,15 +403,8 @@ class SessionStore:
 
         Returns *True* if the session existed and was deleted.
         """
-        path = _session_path(session_id)
-        deleted = False
-        if path.exists():
-            try:
-                path.unlink()
-                deleted = True
-            except OSError:
-                log.exception("Failed to delete session file %s", path)
-        self._remove_from_index(session_id)
+        deleted = self._delete_file(session_id)
+        self._remove_from_index([session_id])
         return deleted
 
     def prune_sessions(self, max_sessions: int = 50) -> int:
@@ -315,60 +428,144 @@ class SessionStore:
 
         to_delete = len(sessions) - max_sessions
         deleted = 0
+        removed: list[str] = []
         for session in unnamed:
             if deleted >= to_delete:
                 break
-            if self.delete_session(session.session_id):
+            removed.append(session.session_id)
+            if self._delete_file(session.session_id):
                 deleted += 1
 
+        # One index update for the whole batch.
+        self._remove_from_index(removed)
         return deleted
 
+    def _delete_file(self, session_id: str) -> bool:
+        """Close any append writer and unlink the session file.
+
+        Returns *True* if the file existed and was deleted.
+        """
+        writer = self._writers.pop(session_id, None)
+        if writer is not None:
+            try:
+                writer.close()
+            except OSError:
+                log.exception("Failed to flush session %s", session_id)
+        path = _session_path(session_id)
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            return False
+        except OSError:
+            log.exception("Failed to delete session file %s", path)
+            return False
+        return True
+
     # -- index management --------------------------------------------------
 
     def _update_index(self, meta: SessionMeta) -> None:
         """Add or update a session entry in ``index.json``."""
-        index = self._load_index()
-        # Replace existing entry if present.
-        index = [e for e in index if e.get("session_id") != meta.session_id]
-        index.append(asdict(meta))
-        self._write_index(index)
-
-    def _remove_from_index(self, session_id: str) -> None:
-        """Remove a session from ``index.json``."""
-        index = self._load_index()
-        new_index = [e for e in index if e.get("session_id") != session_id]
-        if len(new_index) != len(index):
-            self._write_index(new_index)
-
-    def _load_index(self) -> list[dict]:
-        """Read ``index.json``, returning an empty list on any failure."""
-        if not INDEX_PATH.exists():
-            return []
+        with self._index_lock:
+            self._load_index()[meta.session_id] = meta
+            self._mark_index_dirty()
+
+    def _remove_from_index(self, session_ids: Iterable[str]) -> None:
+        """Remove sessions from ``index.json`` with a single index update."""
+        with self._index_lock:
+            index = self._load_index()
+            changed = False
+            for session_id in session_ids:
+                if index.pop(session_id, None) is not None:
+                    changed = True
+            if changed:
+                self._mark_index_dirty()
+
+    def _mark_index_dirty(self) -> None:
+        """Schedule a write of the changed index. Caller holds ``_index_lock``.
+
+        Changes arriving before the timer fires (e.g. the user and assistant
+        halves of a turn) share one write, rename and fsync.
+        """
+        self._sorted = None
+        self._index_dirty = True
+        if self._flush_timer is None:
+            timer = threading.Timer(_INDEX_FLUSH_DELAY, self._flush_index)
+            timer.daemon = True
+            self._flush_timer = timer
+            timer.start()
+
+    def _flush_index(self) -> None:
+        """Write ``index.json`` now if it has unsaved changes."""
+        with self._index_lock:
+            self._flush_timer = None
+            if self._index_dirty:
+                self._index_dirty = False
+                self._write_index()
+
+    def _load_index(self) -> dict[str, SessionMeta]:
+        """Return the cached index, re-reading ``index.json`` if it changed.
+
+        A ``stat`` of the file decides whether the cache is still current.
+        Any failure yields an empty index; malformed entries are skipped.
+        While changes are waiting to be flushed the cache is authoritative.
+        Caller holds ``_index_lock``.
+        """
+        assert self._index_lock.locked()
+        if self._index is not None and self._index_dirty:
+            return self._index
         try:
-            data = json.loads(INDEX_PATH.read_text(encoding="utf-8"))
-            if isinstance(data, list):
-                return data
-            log.warning("index.json is not a JSON array; resetting")
-            return []
-        except (json.JSONDecodeError, OSError):
+            mtime = INDEX_PATH.stat().st_mtime_ns
+        except OSError:
+            mtime = 0
+        if self._index is not None and mtime == self._index_mtime:
+            return self._index
+
+        self._index = {}
+        self._index_mtime = mtime
+        self._sorted = None
+        if not mtime:
+            return self._index
+        try:
+            data = orjson.loads(INDEX_PATH.read_bytes())
+        except (orjson.JSONDecodeError, OSError):
             log.warning("Corrupt or unreadable index.json; resetting")
-            return []
+            return self._index
+        if not isinstance(data, list):
+            log.warning("index.json is not a JSON array; resetting")
+            return self._index
+
+        for entry in data:
+            try:
+                meta = SessionMeta(**entry)
+            except TypeError:
+                log.warning("Skipping malformed index entry: %s", entry)
+                continue
+            self._index[meta.session_id] = meta
+        return self._index
 
-    def _write_index(self, index: list[dict]) -> None:
-        """Atomically overwrite ``index.json``."""
+    def _write_index(self) -> None:
+        """Atomically and durably overwrite ``index.json`` from the cache."""
         tmp = INDEX_PATH.with_suffix(".tmp")
         try:
-            tmp.write_text(
-                json.dumps(index, ensure_ascii=False), encoding="utf-8"
-            )
-            tmp.replace(INDEX_PATH)
+            with tmp.open("wb") as fh:
+                fh.write(orjson.dumps(list(self._index.values())))
+                fh.flush()
+                os.fsync(fh.fileno())
+            os.replace(tmp, INDEX_PATH)
+            _fsync_dir(SESSIONS_DIR)
+            self._index_mtime = INDEX_PATH.stat().st_mtime_ns
         except OSError:
             log.exception("Failed to write index.json")
             # Clean up temp file if it exists.
             tmp.unlink(missing_ok=True)
 
     def _refresh_meta_from_file(self, session_id: str) -> None:
-        """Re-read a session file and update the index with fresh counts."""
+        """Re-read a session file and update the index with fresh counts.
+
+        Recovery path for sessions missing from the index; ``append_message``
+        otherwise updates the cached entry incrementally.
+        """
+        self.flush(session_id)
         try:
             data = self.load_session(session_id)
         except (FileNotFoundError, ValueError):
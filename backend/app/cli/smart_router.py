@@ -11,6 +11,7 @@ from __future__ import annotations
 import enum
 import re
 from dataclasses import dataclass
+from functools import lru_cache
 
 
 # ---------------------------------------------------------------------------
@@ -60,6 +61,51 @@ KEYWORD_SIGNALS: dict[TaskCategory, list[str]] = {
     ],
 }
 
+
+def _build_keyword_index() -> tuple[
+    re.Pattern[str], tuple[TaskCategory, ...], dict[str, tuple[int, ...]]
+]:
+    """Flatten ``KEYWORD_SIGNALS`` into one pattern and two lookup tables.
+
+    Every ``(category, keyword)`` entry gets an integer id; the second
+    return value holds each id's category. The pattern captures, at each
+    word boundary, the longest keyword that starts there; the lookahead
+    keeps matches zero-width so overlapping keywords (e.g. "analyze code"
+    and "code quality") are all found. A keyword that is a prefix of a
+    longer one (e.g. "write" in "write a story") also matches wherever the
+    longer one does, so the third table maps each captured keyword to the
+    ids of every entry it implies. A character-class check on the keywords'
+    first letters rejects most positions before the alternation is tried.
+    """
+    entries = [
+        (category, kw)
+        for category, keywords in KEYWORD_SIGNALS.items()
+        for kw in keywords
+    ]
+    ordered = sorted({kw for _, kw in entries}, key=len, reverse=True)
+    first = "".join(sorted({kw[0] for kw in ordered}))
+    pattern = re.compile(
+        r"\b(?=[" + re.escape(first) + r"])"
+        r"(?=(" + "|".join(re.escape(kw) for kw in ordered) + r"))"
+    )
+    categories = tuple(category for category, _ in entries)
+    hits = {
+        kw: tuple(i for i, (_, entry_kw) in enumerate(entries) if kw.startswith(entry_kw))
+        for kw in ordered
+    }
+    return pattern, categories, hits
+
+
+# A single pass over the prompt finds the keywords of every category.
+_KEYWORD_PATTERN, _ENTRY_CATEGORY, _KEYWORD_HITS = _build_keyword_index()
+
+# A prompt containing none of the keywords' first letters cannot match any
+# of them (e.g. non-Latin text). A character-class search checks that in C
+# without creating a string per character, unlike a set-based test.
+_KEYWORD_FIRST_CHAR: re.Pattern[str] = re.compile(
+    "[" + re.escape("".join(sorted({kw[0] for kw in _KEYWORD_HITS}))) + "]"
+)
+
 # ---------------------------------------------------------------------------
 # Default model routes  (OpenRouter model IDs)
 # ---------------------------------------------------------------------------
@@ -80,6 +126,9 @@ _RELEVANCE_THRESHOLD: float = 0.1
 # When 2+ categories exceed this threshold, suggest a crew run.
 _CREW_SUGGEST_THRESHOLD: float = 0.3
 
+# Number of recent prompts whose routing decisions each router remembers.
+_ROUTE_CACHE_SIZE: int = 64
+
 
 # ---------------------------------------------------------------------------
 # Classifier
@@ -92,6 +141,11 @@ class TaskClassifier:
     calls are made -- classification is instantaneous.
     """
 
+    # Only the first ``MAX_SCAN`` characters of a prompt are scanned. The
+    # instruction that carries the task signal comes first; a long paste
+    # after it would only add scan time, not change the result.
+    MAX_SCAN: int = 4096
+
     @staticmethod
     def classify(prompt: str) -> list[tuple[TaskCategory, float]]:
         """Classify *prompt* into task categories with confidence scores.
@@ -100,14 +154,22 @@ class TaskClassifier:
         confidence descending.  Only categories above the relevance
         threshold (0.1) are included.  Confidence is 0.0--1.0 based on
         keyword match density.
+
+        Only the first ``MAX_SCAN`` characters are considered, so keywords
+        that appear only deep inside a long paste do not count.
         """
-        text = prompt.lower()
-        scores: dict[TaskCategory, int] = {}
+        text = prompt[: TaskClassifier.MAX_SCAN].lower()
+        if _KEYWORD_FIRST_CHAR.search(text) is None:
+            return [(TaskCategory.GENERAL, 1.0)]
 
-        for category, keywords in KEYWORD_SIGNALS.items():
-            hits = sum(1 for kw in keywords if re.search(r"\b" + re.escape(kw), text))
-            if hits:
-                scores[category] = hits
+        # Hits count distinct keywords, however often each one appears.
+        matched: set[int] = set()
+        for kw in set(_KEYWORD_PATTERN.findall(text)):
+            matched.update(_KEYWORD_HITS[kw])
+        counts = dict.fromkeys(KEYWORD_SIGNALS, 0)
+        for entry in matched:
+            counts[_ENTRY_CATEGORY[entry]] += 1
+        scores = {category: hits for category, hits in counts.items() if hits}
 
         if not scores:
             return [(TaskCategory.GENERAL, 1.0)]
@@ -173,6 +235,10 @@ class SmartRouter:
     route_overrides:
         Optional user-supplied mapping of ``TaskCategory.value`` strings
         to model IDs.  Overrides take precedence over ``DEFAULT_ROUTES``.
+
+    Routing is a pure function of the prompt once the router is built, so
+    decisions for recent prompts (retries, history recall) are cached, as
+    is the route table.
     """
 
     def __init__(
@@ -181,12 +247,32 @@ class SmartRouter:
         route_overrides: dict[str, str] | None = None,
     ) -> None:
         self._default_model = default_model
-        self._overrides: dict[str, str] = route_overrides or {}
+        self._overrides: dict[str, str] = dict(route_overrides or {})
+        self._route_cached = lru_cache(maxsize=_ROUTE_CACHE_SIZE)(self._route)
+        self._route_table: dict[str, str] | None = None
 
     # -- public API --------------------------------------------------------
 
     def route(self, prompt: str) -> RoutingDecision:
         """Classify *prompt* and return a ``RoutingDecision``."""
+        return self._route_cached(prompt)
+
+    def get_route_table(self) -> dict[str, str]:
+        """Return the effective route table (defaults merged with overrides).
+
+        Keys are ``TaskCategory.value`` strings; values are model IDs.
+        Used by the ``/route`` command to display current routing config.
+        """
+        if self._route_table is None:
+            self._route_table = {
+                cat.value: self._resolve_model(cat) for cat in TaskCategory
+            }
+        return dict(self._route_table)
+
+    # -- internal ----------------------------------------------------------
+
+    def _route(self, prompt: str) -> RoutingDecision:
+        """Uncached body of ``route``."""
         ranked = TaskClassifier.classify(prompt)
         top_category, top_confidence = ranked[0]
 
@@ -208,19 +294,6 @@ class SmartRouter:
             suggest_crew=suggest_crew,
         )
 
-    def get_route_table(self) -> dict[str, str]:
-        """Return the effective route table (defaults merged with overrides).
-
-        Keys are ``TaskCategory.value`` strings; values are model IDs.
-        Used by the ``/route`` command to display current routing config.
-        """
-        table: dict[str, str] = {}
-        for cat in TaskCategory:
-            table[cat.value] = self._resolve_model(cat)
-        return table
-
-    # -- internal ----------------------------------------------------------
-
     def _resolve_model(self, category: TaskCategory) -> str:
         """Pick the model for *category*.
 
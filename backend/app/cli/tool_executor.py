@@ -7,7 +7,9 @@ the model produces a response with no tool calls or the round limit is hit.
 
 from __future__ import annotations
 
+import asyncio
 import json
+from functools import cached_property
 from pathlib import Path
 from typing import Callable
 
@@ -93,6 +95,7 @@ class ToolExecutor:
         response_text: str,
         stream_fn: Callable,
         messages: list[dict[str, str]],
+        tool_calls: list[dict] | None = None,
     ) -> tuple[str, list[dict[str, str]]]:
         """Process a model response, executing any embedded tool calls.
 
@@ -107,18 +110,25 @@ class ToolExecutor:
         messages:
             The conversation history so far.  **Mutated in place** -- tool
             results and follow-up assistant messages are appended.
+        tool_calls:
+            Calls already parsed from *response_text* while it streamed
+            (see ``ToolCallStreamParser``). Parsed here when omitted.
 
         Returns
         -------
         tuple[str, list[dict[str, str]]]
-            ``(final_response_text, updated_messages)`` where the final text
-            is the model's last reply that contained no tool calls.
+            ``(final_response_text, new_messages)`` where the final text is
+            the model's last reply that contained no tool calls and
+            ``new_messages`` holds only the messages appended to *messages*,
+            so callers can sync them without diffing the whole history.
         """
         current_text = response_text
         round_count = 0
+        new_messages: list[dict[str, str]] = []
 
         while round_count < self._max_rounds:
-            tool_calls = parse_tool_calls(current_text)
+            if tool_calls is None:
+                tool_calls = parse_tool_calls(current_text)
             if not tool_calls:
                 break
 
@@ -128,18 +138,20 @@ class ToolExecutor:
                 f"({len(tool_calls)} call{'s' if len(tool_calls) != 1 else ''})[/]"
             )
 
-            results: list[str] = []
-            for call in tool_calls:
-                result_str = await self._handle_single_call(call)
-                results.append(result_str)
+            results = await self._run_calls(tool_calls)
 
             # Inject the assistant message and aggregated results into history
             results_text = "\n\n".join(results)
-            messages.append({"role": "assistant", "content": current_text})
-            messages.append({"role": "user", "content": results_text})
+            assistant_msg = {"role": "assistant", "content": current_text}
+            results_msg = {"role": "user", "content": results_text}
+            messages.append(assistant_msg)
+            messages.append(results_msg)
+            new_messages.append(assistant_msg)
+            new_messages.append(results_msg)
 
             # Call the model again so it can react to the tool output
             current_text, _, _ = await stream_fn(messages)
+            tool_calls = None
 
         if round_count >= self._max_rounds:
             print_warning(
@@ -148,7 +160,39 @@ class ToolExecutor:
                 "Increase max_rounds or continue the conversation.",
             )
 
-        return current_text, messages
+        return current_text, new_messages
+
+    # -- call scheduling ----------------------------------------------------
+
+    async def _run_calls(self, tool_calls: list[dict]) -> list[str]:
+        """Run one round's calls and return their results in call order.
+
+        Consecutive calls to ``AUTO`` tools (read-only, never prompting) run
+        concurrently with ``asyncio.gather``. Every other call runs on its
+        own, in order: ``ASK`` prompts need the terminal to themselves, and
+        a write or shell command must not race the calls around it. Yolo
+        mode skips prompts but not this ordering.
+        """
+        results: list[str] = []
+        batch: list[dict] = []
+        for call in tool_calls:
+            tool = self._registry.get(call.get("tool", ""))
+            if tool is not None and tool.permission == PermissionLevel.AUTO:
+                batch.append(call)
+                continue
+            if batch:
+                results.extend(await self._gather_calls(batch))
+                batch = []
+            results.append(await self._handle_single_call(call))
+        if batch:
+            results.extend(await self._gather_calls(batch))
+        return results
+
+    async def _gather_calls(self, calls: list[dict]) -> list[str]:
+        """Run independent *calls* concurrently, keeping their order."""
+        if len(calls) == 1:
+            return [await self._handle_single_call(calls[0])]
+        return list(await asyncio.gather(*(self._handle_single_call(c) for c in calls)))
 
     # -- single-call handler ------------------------------------------------
 
@@ -267,6 +311,10 @@ class ToolExecutor:
         Append this to the model's system prompt so it knows what tools
         exist, how to invoke them, and the expected XML format.
         """
+        return self._tool_system_prompt
+
+    @cached_property
+    def _tool_system_prompt(self) -> str:
         tools_desc = self._registry.tool_descriptions()
         return (
             "\n\nYou have access to the following tools. "
@@ -10,12 +10,15 @@ and results are injected back as ``<tool_result>`` blocks.
 
 from __future__ import annotations
 
+import asyncio
 import enum
 import json
+import os
 import re
-import subprocess
+import signal
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
+from functools import cached_property
 from pathlib import Path
 from typing import Sequence
 
@@ -78,10 +81,15 @@ _DANGEROUS_PATTERNS: list[str] = [
     r"chmod\s+-R\s+777\s+/",
 ]
 
+# All patterns as one alternation, compiled once: a check is a single scan.
+_DANGEROUS_RE: re.Pattern[str] = re.compile(
+    "|".join(f"(?:{p})" for p in _DANGEROUS_PATTERNS)
+)
+
 
 def _is_dangerous(command: str) -> bool:
     """Return ``True`` if *command* matches a known destructive pattern."""
-    return any(re.search(p, command) for p in _DANGEROUS_PATTERNS)
+    return _DANGEROUS_RE.search(command) is not None
 
 
 # ---------------------------------------------------------------------------
@@ -93,6 +101,49 @@ _FILE_READ_CAP = 20_000   # max chars when reading a file
 _DEFAULT_TIMEOUT = 30     # seconds
 _MAX_TIMEOUT = 120        # seconds
 _TEST_TIMEOUT = 120       # seconds
+_PROBE_TIMEOUT = 5        # seconds, for "is this linter installed" checks
+
+
+_POSIX = os.name == "posix"
+
+
+def _kill_process_group(proc: asyncio.subprocess.Process) -> None:
+    """Kill *proc* and, on POSIX, every process it started."""
+    if not _POSIX:
+        proc.kill()
+        return
+    try:
+        os.killpg(proc.pid, signal.SIGKILL)
+    except ProcessLookupError:
+        pass
+
+
+async def _run_shell(command: str, cwd: Path, timeout: float) -> tuple[int, str, str]:
+    """Run *command* through the shell without blocking the event loop.
+
+    Returns ``(returncode, stdout, stderr)``, each stream decoded and capped
+    at ``_OUTPUT_CAP`` characters. On timeout the process group is killed
+    and ``TimeoutError`` is raised. The command gets its own process
+    group so that children holding the output pipes die with the shell.
+    """
+    proc = await asyncio.create_subprocess_shell(
+        command,
+        cwd=cwd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        start_new_session=_POSIX,
+    )
+    try:
+        stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+    except (TimeoutError, asyncio.CancelledError):
+        _kill_process_group(proc)
+        await proc.wait()
+        raise
+    return (
+        proc.returncode,
+        stdout.decode(errors="replace")[:_OUTPUT_CAP],
+        stderr.decode(errors="replace")[:_OUTPUT_CAP],
+    )
 
 
 class ShellTool(Tool):
@@ -120,28 +171,19 @@ class ShellTool(Tool):
         timeout = min(int(arguments.get("timeout", _DEFAULT_TIMEOUT)), _MAX_TIMEOUT)
 
         try:
-            proc = subprocess.run(
-                command,
-                shell=True,
-                capture_output=True,
-                text=True,
-                timeout=timeout,
-                cwd=cwd,
-            )
-            stdout = proc.stdout[:_OUTPUT_CAP] if proc.stdout else ""
-            stderr = proc.stderr[:_OUTPUT_CAP] if proc.stderr else ""
+            returncode, stdout, stderr = await _run_shell(command, cwd, timeout)
 
-            if proc.returncode == 0:
+            if returncode == 0:
                 return ToolResult(success=True, output=stdout or "(no output)")
             else:
-                combined = f"Exit code {proc.returncode}\n"
+                combined = f"Exit code {returncode}\n"
                 if stdout:
                     combined += f"stdout:\n{stdout}\n"
                 if stderr:
                     combined += f"stderr:\n{stderr}"
                 return ToolResult(success=False, output="", error=combined.strip())
 
-        except subprocess.TimeoutExpired:
+        except TimeoutError:
             return ToolResult(
                 success=False,
                 output="",
@@ -162,7 +204,11 @@ class ReadFileTool(Tool):
         raw_path: str | None = arguments.get("path")
         if not raw_path:
             return ToolResult(success=False, output="", error="Missing required argument: path")
+        # File I/O runs in a worker thread so concurrent reads overlap.
+        return await asyncio.to_thread(self._read, raw_path, cwd)
 
+    @staticmethod
+    def _read(raw_path: str, cwd: Path) -> ToolResult:
         target = (cwd / raw_path).resolve()
         if not target.is_relative_to(cwd.resolve()):
             return ToolResult(
@@ -251,29 +297,20 @@ class RunTestsTool(Tool):
             )
 
         try:
-            proc = subprocess.run(
-                command,
-                shell=True,
-                capture_output=True,
-                text=True,
-                timeout=_TEST_TIMEOUT,
-                cwd=cwd,
-            )
-            stdout = proc.stdout[:_OUTPUT_CAP] if proc.stdout else ""
-            stderr = proc.stderr[:_OUTPUT_CAP] if proc.stderr else ""
+            returncode, stdout, stderr = await _run_shell(command, cwd, _TEST_TIMEOUT)
             combined = stdout
             if stderr:
                 combined += f"\n{stderr}" if combined else stderr
 
-            if proc.returncode == 0:
+            if returncode == 0:
                 return ToolResult(success=True, output=combined or "Tests passed (no output)")
             else:
                 return ToolResult(
                     success=False,
                     output="",
-                    error=f"Tests failed (exit {proc.returncode}):\n{combined}".strip(),
+                    error=f"Tests failed (exit {returncode}):\n{combined}".strip(),
                 )
-        except subprocess.TimeoutExpired:
+        except TimeoutError:
             return ToolResult(
                 success=False,
                 output="",
@@ -338,7 +375,7 @@ class LintTool(Tool):
 
     async def execute(self, arguments: dict, cwd: Path) -> ToolResult:
         extra_args = arguments.get("args", "")
-        command = self._detect_linter(cwd, extra_args)
+        command = await self._detect_linter(cwd, extra_args)
         if command is None:
             return ToolResult(
                 success=False,
@@ -347,29 +384,20 @@ class LintTool(Tool):
             )
 
         try:
-            proc = subprocess.run(
-                command,
-                shell=True,
-                capture_output=True,
-                text=True,
-                timeout=_TEST_TIMEOUT,
-                cwd=cwd,
-            )
-            stdout = proc.stdout[:_OUTPUT_CAP] if proc.stdout else ""
-            stderr = proc.stderr[:_OUTPUT_CAP] if proc.stderr else ""
+            returncode, stdout, stderr = await _run_shell(command, cwd, _TEST_TIMEOUT)
             combined = stdout
             if stderr:
                 combined += f"\n{stderr}" if combined else stderr
 
-            if proc.returncode == 0:
+            if returncode == 0:
                 return ToolResult(success=True, output=combined or "No lint issues found")
             else:
                 return ToolResult(
                     success=False,
                     output="",
-                    error=f"Lint issues found (exit {proc.returncode}):\n{combined}".strip(),
+                    error=f"Lint issues found (exit {returncode}):\n{combined}".strip(),
                 )
-        except subprocess.TimeoutExpired:
+        except TimeoutError:
             return ToolResult(
                 success=False,
                 output="",
@@ -379,19 +407,25 @@ class LintTool(Tool):
             return ToolResult(success=False, output="", error=str(exc))
 
     @staticmethod
-    def _detect_linter(cwd: Path, extra_args: str) -> str | None:
+    async def _detect_linter(cwd: Path, extra_args: str) -> str | None:
         """Return a shell command for the detected linter, or ``None``."""
         suffix = f" {extra_args}" if extra_args else ""
 
         # Python: ruff
         try:
-            subprocess.run(
-                ["ruff", "--version"],
-                capture_output=True,
-                timeout=5,
+            proc = await asyncio.create_subprocess_exec(
+                "ruff", "--version",
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.DEVNULL,
             )
+            try:
+                await asyncio.wait_for(proc.wait(), _PROBE_TIMEOUT)
+            except (TimeoutError, asyncio.CancelledError):
+                proc.kill()
+                await proc.wait()
+                raise
             return f"ruff check .{suffix}"
-        except (FileNotFoundError, subprocess.TimeoutExpired):
+        except (FileNotFoundError, TimeoutError):
             pass
 
         # JavaScript/TypeScript: eslint
@@ -444,6 +478,11 @@ class ToolRegistry:
         Returns a multi-line string describing each tool, its permission
         level, and a short description.
         """
+        return self._descriptions
+
+    @cached_property
+    def _descriptions(self) -> str:
+        # The tool set is fixed at construction, so this is built once.
         lines: list[str] = ["Available tools:"]
         for tool in self._tools.values():
             perm = tool.permission.value
@@ -455,6 +494,61 @@ class ToolRegistry:
 # Tool-call parsing
 # ---------------------------------------------------------------------------
 
+_TOOL_CALL_OPEN = "<tool_call>"
+_TOOL_CALL_CLOSE = "</tool_call>"
+
+
+class ToolCallStreamParser:
+    """Incrementally extract tool calls from streamed assistant text.
+
+    Feed chunks as they arrive; each call to ``feed`` returns the tool calls
+    whose closing tag has just been seen. Tags are located with ``str.find``
+    and only the unfinished tail is kept, so text is never rescanned: while
+    a block is open, the search for its closing tag resumes where the last
+    chunk ended. Malformed JSON blocks are silently skipped.
+    """
+
+    __slots__ = ("_buf", "_scan")
+
+    def __init__(self) -> None:
+        self._buf = ""
+        # Offset in ``_buf`` from which to resume looking for the next tag.
+        self._scan = 0
+
+    def feed(self, chunk: str) -> list[dict]:
+        """Consume *chunk* and return any tool calls it completed."""
+        buf = self._buf + chunk
+        calls: list[dict] = []
+        pos = 0
+        scan = self._scan
+        while True:
+            start = buf.find(_TOOL_CALL_OPEN, pos)
+            if start == -1:
+                # Keep just enough to catch an opening tag split across chunks.
+                pos = max(pos, len(buf) - len(_TOOL_CALL_OPEN) + 1)
+                scan = 0
+                break
+            end = buf.find(_TOOL_CALL_CLOSE, max(scan, start + len(_TOOL_CALL_OPEN)))
+            if end == -1:
+                # Block still open: keep it, resume the close search later.
+                pos = start
+                scan = max(start, len(buf) - len(_TOOL_CALL_CLOSE) + 1) - start
+                break
+            # The innermost opening tag before the close owns the block.
+            start = buf.rfind(_TOOL_CALL_OPEN, start, end)
+            body = buf[start + len(_TOOL_CALL_OPEN):end].strip()
+            if body.startswith("{") and body.endswith("}"):
+                try:
+                    calls.append(json.loads(body))
+                except json.JSONDecodeError:
+                    pass
+            pos = end + len(_TOOL_CALL_CLOSE)
+            scan = 0
+        self._buf = buf[pos:]
+        self._scan = scan
+        return calls
+
+
 def parse_tool_calls(text: str) -> list[dict]:
     """Extract tool calls from ``<tool_call>`` XML blocks in *text*.
 
@@ -465,15 +559,7 @@ def parse_tool_calls(text: str) -> list[dict]:
     Returns a list of parsed dicts.  Malformed JSON blocks are silently
     skipped.
     """
-    pattern = r"<tool_call>\s*(\{.*?\})\s*</tool_call>"
-    matches = re.findall(pattern, text, re.DOTALL)
-    calls: list[dict] = []
-    for m in matches:
-        try:
-            calls.append(json.loads(m))
-        except json.JSONDecodeError:
-            continue
-    return calls
+    return ToolCallStreamParser().feed(text)
 
 
 def format_tool_result(tool_name: str, result: ToolResult) -> str:
@@ -0,0 +1,118 @@
+"""Shared HTTP transport for OpenRouter requests.
+
+Every CLI code path talks to the same host, so a single long-lived
+``httpx.AsyncClient`` with HTTP/2 enabled lets consecutive requests (REPL
+turns, crew fan-out) reuse one TLS connection instead of handshaking per call.
+
+An ``AsyncClient`` is bound to the event loop that first used it. The CLI
+calls ``asyncio.run`` more than once per process (model picker, then REPL),
+so the shared client is tracked per loop and rebuilt when the loop changes.
+
+All OpenRouter requests also pass through one ``request_limiter()`` semaphore
+so that ``/compare`` and crew fan-out together stay under the account's rate
+limit instead of tripping 429s.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+
+import httpx
+
+from app.cli.config import resolve_max_concurrency
+
+# ---------------------------------------------------------------------------
+# Client settings
+# ---------------------------------------------------------------------------
+
+REQUEST_TIMEOUT: float = 120.0
+
+CLIENT_LIMITS = httpx.Limits(max_keepalive_connections=4, keepalive_expiry=60)
+
+_client: httpx.AsyncClient | None = None
+_client_loop: asyncio.AbstractEventLoop | None = None
+
+_limiter: asyncio.Semaphore | None = None
+_limiter_loop: asyncio.AbstractEventLoop | None = None
+
+
+def create_client() -> httpx.AsyncClient:
+    """Build a new HTTP/2 client with the CLI's keep-alive limits."""
+    return httpx.AsyncClient(http2=True, timeout=REQUEST_TIMEOUT, limits=CLIENT_LIMITS)
+
+
+def get_client() -> httpx.AsyncClient:
+    """Return the shared client for the running event loop.
+
+    Must be called from inside a coroutine. Pair with ``aclose_client()``
+    before the loop exits so pooled connections are shut down cleanly.
+    """
+    global _client, _client_loop
+
+    loop = asyncio.get_running_loop()
+    if _client is None or _client.is_closed or _client_loop is not loop:
+        _client = create_client()
+        _client_loop = loop
+    return _client
+
+
+async def aclose_client() -> None:
+    """Close the shared client if it belongs to the running event loop."""
+    global _client, _client_loop
+
+    if _client is None:
+        return
+    if _client_loop is asyncio.get_running_loop() and not _client.is_closed:
+        await _client.aclose()
+    _client = None
+    _client_loop = None
+
+
+def request_limiter() -> asyncio.Semaphore:
+    """Return the semaphore bounding in-flight OpenRouter requests.
+
+    Sized from ``resolve_max_concurrency()`` and, like the client, scoped to
+    the running event loop. Hold it for the whole request, including the
+    streamed body.
+    """
+    global _limiter, _limiter_loop
+
+    loop = asyncio.get_running_loop()
+    if _limiter is None or _limiter_loop is not loop:
+        _limiter = asyncio.Semaphore(resolve_max_concurrency())
+        _limiter_loop = loop
+    return _limiter
+
+
+# ---------------------------------------------------------------------------
+# Server-sent events
+# ---------------------------------------------------------------------------
+
+_DATA_PREFIX = b"data:"
+_DATA_PREFIX_LEN = len(_DATA_PREFIX)
+_DONE_MARKER = b"[DONE]"
+
+
+async def iter_sse_data(response: httpx.Response) -> AsyncIterator[bytes]:
+    """Yield the raw ``data:`` payloads of an SSE response until ``[DONE]``.
+
+    Framing is done on bytes: chunks are appended to a carry buffer and
+    split on ``b"\\n"``, so keep-alive and comment lines are dropped without
+    ever being decoded. Payloads are returned as bytes, ready for
+    ``orjson.loads``.
+    """
+    buf = bytearray()
+    async for chunk in response.aiter_bytes(65536):
+        buf += chunk
+        start = 0
+        while (nl := buf.find(b"\n", start)) != -1:
+            line = bytes(buf[start:nl])
+            start = nl + 1
+            if not line.startswith(_DATA_PREFIX):
+                continue
+            payload = line[_DATA_PREFIX_LEN:].strip()
+            if payload == _DONE_MARKER:
+                return
+            yield payload
+        del buf[:start]
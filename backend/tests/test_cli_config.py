@@ -0,0 +1,44 @@
+import pytest
+
+from app.cli import config
+from app.cli.config import (
+    DEFAULT_MAX_CONCURRENCY,
+    MAX_CONCURRENCY_ENV_VAR,
+    resolve_max_concurrency,
+)
+
+
+@pytest.fixture()
+def config_file(tmp_path, monkeypatch):
+    path = tmp_path / ".code_swap.yaml"
+    monkeypatch.setattr(config, "CONFIG_PATH", path)
+    monkeypatch.delenv(MAX_CONCURRENCY_ENV_VAR, raising=False)
+    return path
+
+
+def test_default_without_env_or_config(config_file):
+    assert resolve_max_concurrency() == DEFAULT_MAX_CONCURRENCY
+
+
+def test_config_file_value(config_file):
+    config_file.write_text("max_concurrency: 3\n")
+    assert resolve_max_concurrency() == 3
+
+
+def test_env_var_overrides_config_file(config_file, monkeypatch):
+    config_file.write_text("max_concurrency: 3\n")
+    monkeypatch.setenv(MAX_CONCURRENCY_ENV_VAR, "11")
+    assert resolve_max_concurrency() == 11
+
+
+@pytest.mark.parametrize("env_value", ["0", "-2", "four", "2.5", ""])
+def test_invalid_env_var_falls_back_to_config_file(config_file, monkeypatch, env_value):
+    config_file.write_text("max_concurrency: 3\n")
+    monkeypatch.setenv(MAX_CONCURRENCY_ENV_VAR, env_value)
+    assert resolve_max_concurrency() == 3
+
+
+@pytest.mark.parametrize("raw", ["0", "-1", "'8'", "2.5", "true", "null"])
+def test_invalid_config_value_falls_back_to_default(config_file, raw):
+    config_file.write_text(f"max_concurrency: {raw}\n")
+    assert resolve_max_concurrency() == DEFAULT_MAX_CONCURRENCY
@@ -0,0 +1,88 @@
+import asyncio
+import shutil
+import subprocess
+
+import pytest
+
+from app.cli.git_context import (
+    _DIFF_MAX_CHARS,
+    DiffStat,
+    get_diff_numstat,
+    get_diff_shortstat,
+    read_diff,
+)
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+
+
+def _git(repo, *args):
+    subprocess.run(
+        ["git", "-c", "user.name=t", "-c", "user.email=t@example.com", *args],
+        cwd=repo,
+        check=True,
+        capture_output=True,
+    )
+
+
+@pytest.fixture()
+def repo(tmp_path):
+    _git(tmp_path, "init", "-q")
+    (tmp_path / "a.txt").write_text("one\ntwo\n")
+    (tmp_path / "b.txt").write_text("keep\n")
+    _git(tmp_path, "add", ".")
+    _git(tmp_path, "commit", "-q", "-m", "init")
+    return tmp_path
+
+
+def test_clean_tree(repo):
+    assert asyncio.run(get_diff_shortstat(repo)) == DiffStat(0, 0, 0)
+    assert asyncio.run(read_diff(repo)) == ""
+
+
+def test_shortstat_numstat_and_diff(repo):
+    (repo / "a.txt").write_text("one\nTWO\nthree\n")
+    (repo / "b.txt").unlink()
+
+    assert asyncio.run(get_diff_shortstat(repo)) == DiffStat(2, 2, 2)
+    numstat = asyncio.run(get_diff_numstat(repo))
+    rows = {row.path: (row.insertions, row.deletions) for row in numstat}
+    assert rows == {"a.txt": (2, 1), "b.txt": (0, 1)}
+
+    diff = asyncio.run(read_diff(repo))
+    assert "+TWO" in diff and "-keep" in diff
+    assert "truncated" not in diff
+
+
+def test_staged_only(repo):
+    (repo / "a.txt").write_text("staged\n")
+    _git(repo, "add", "a.txt")
+    (repo / "b.txt").write_text("unstaged\n")
+
+    assert asyncio.run(get_diff_shortstat(repo, staged_only=True)).files_changed == 1
+    staged = asyncio.run(read_diff(repo, staged_only=True))
+    assert "+staged" in staged and "unstaged" not in staged
+
+
+def test_read_diff_handles_lines_longer_than_the_stream_limit(repo):
+    (repo / "a.txt").write_text("é" * 200_000 + "\n")
+
+    diff = asyncio.run(read_diff(repo))
+
+    assert diff.endswith("\n... (truncated)")
+    assert len(diff) == _DIFF_MAX_CHARS + len("\n... (truncated)")
+    assert "�" not in diff
+
+
+def test_non_ascii_diff_under_the_char_cap_is_kept_whole(repo):
+    # About 12 KB of UTF-8, but well under the character cap.
+    (repo / "a.txt").write_text("é" * 6_000 + "\n")
+
+    diff = asyncio.run(read_diff(repo))
+
+    assert "truncated" not in diff
+    assert diff.count("é") == 6_000
+
+
+def test_outside_a_repository(tmp_path):
+    assert asyncio.run(get_diff_shortstat(tmp_path)) is None
+    assert asyncio.run(read_diff(tmp_path)) == ""
@@ -0,0 +1,91 @@
+import asyncio
+import io
+
+import pytest
+from rich.console import Console
+from rich.markdown import Markdown
+
+from app.cli import output
+from app.cli.output import StreamingDisplay
+
+DOCUMENTS = [
+    "1. a\n\n1. b\n\n1. c\n",
+    "# Title\n\nSome paragraph.\n\n- x\n\n  continuation para\n\n- y\n\nAfter the list.\n",
+    "Intro:\n\n```py\nx = 1\n\n\ny = 2\n```\n\nDone **bold**.",
+    "Para one\nline two\n\n> quote\n\n---\n\n| a | b |\n|---|---|\n| 1 | 2 |\n\nfinal",
+    "Intro:\n\n1. first\n2. second\n\n   indented para\n\n3. third\n\nDone.\n\n## H2\n\ntext",
+    "---\n\n<div>\nhtml\n</div>\n\n# Head\n\n***\n\n* loose\n\n* list\n",
+]
+
+
+def _console() -> Console:
+    return Console(file=io.StringIO(), width=60, color_system=None)
+
+
+def _stream(text: str, chunk: int) -> tuple[StreamingDisplay, str]:
+    display = StreamingDisplay(_console())
+    display.reset()
+    for i in range(0, len(text), chunk):
+        display.token(text[i : i + chunk])
+    return display, display._rendered_output()
+
+
+def _render_whole(text: str) -> str:
+    console = _console()
+    with console.capture() as capture:
+        console.print(Markdown(text), end="")
+    return capture.get()
+
+
+@pytest.mark.parametrize("chunk", [1, 3, 7, 1000])
+@pytest.mark.parametrize("text", DOCUMENTS)
+def test_streamed_render_matches_whole_document(text, chunk):
+    _, rendered = _stream(text, chunk)
+    assert rendered == _render_whole(text)
+
+
+def test_closed_blocks_commit_early_but_lists_stay_pending():
+    display, _ = _stream("# Title\n\nfirst\n\n1. a\n\n1. b\n\nafter\n\n2. c\n", 2)
+    assert [src for src, _ in display._committed] == ["# Title\n\n", "first\n\n1. a\n\n1. b\n\n"]
+    assert display._pending == "after\n\n2. c\n"
+
+
+def test_open_fence_is_not_committed():
+    display, _ = _stream("```\ncode\n\nmore\n\n", 1)
+    assert display._committed == []
+
+
+def test_queued_tokens_flush_when_the_stream_pauses():
+    async def scenario() -> tuple[str, str]:
+        out = io.StringIO()
+        display = StreamingDisplay(_console())
+        display._stdout, display._out = out, None
+        display.reset()
+        display.token("Hello")
+        display.token(" world")
+        before = out.getvalue()
+        await asyncio.sleep(StreamingDisplay._FLUSH_INTERVAL * 3)
+        return before, out.getvalue()
+
+    before, after = asyncio.run(scenario())
+    assert before == "Hello"
+    assert after == "Hello world"
+
+
+def test_save_result_returns_after_the_file_is_written(tmp_path, monkeypatch):
+    monkeypatch.setattr(output, "RESULTS_DIR", tmp_path / "results")
+
+    path = asyncio.run(output.save_result("ask", "# Résumé"))
+
+    assert path is not None and path.read_text(encoding="utf-8") == "# Résumé"
+
+
+def test_save_result_warns_and_returns_none_when_the_write_fails(tmp_path, monkeypatch):
+    blocker = tmp_path / "results"
+    blocker.write_text("not a directory")
+    monkeypatch.setattr(output, "RESULTS_DIR", blocker)
+    warnings = []
+    monkeypatch.setattr(output, "print_warning", lambda title, detail=None: warnings.append(title))
+
+    assert asyncio.run(output.save_result("ask", "text")) is None
+    assert len(warnings) == 1 and warnings[0].startswith("Failed to save")
@@ -0,0 +1,115 @@
+import asyncio
+import time
+
+import httpx
+import orjson
+import pytest
+
+from app.cli import picker
+
+CATALOG = {
+    "data": [
+        {"id": "zeta/model", "name": "Zeta", "context_length": 8_000},
+        {"id": "anthropic/claude-sonnet-4", "context_length": 200_000},
+    ]
+}
+
+
+@pytest.fixture()
+def server(tmp_path, monkeypatch):
+    """Point the cache at *tmp_path* and serve the catalog from a mock transport."""
+    monkeypatch.setattr(picker, "MODELS_CACHE_DIR", tmp_path / "cache")
+    requests: list[httpx.Request] = []
+    state = {"etag": '"v1"', "body": CATALOG}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.headers.get("if-none-match") == state["etag"]:
+            return httpx.Response(304)
+        return httpx.Response(200, json=state["body"], headers={"ETag": state["etag"]})
+
+    monkeypatch.setattr(
+        picker,
+        "create_client",
+        lambda: httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+    state["requests"] = requests
+    return state
+
+
+def _fetch(force_refresh: bool = False) -> list[dict]:
+    return asyncio.run(picker.fetch_models("sk-test", force_refresh=force_refresh))
+
+
+def _age_cache(seconds: float) -> None:
+    path = picker._cache_path("sk-test")
+    payload = orjson.loads(path.read_bytes())
+    payload["fetched_at"] = time.time() - seconds
+    path.write_bytes(orjson.dumps(payload))
+
+
+def test_first_fetch_writes_the_cache(server):
+    models = _fetch()
+
+    assert [m["id"] for m in models] == ["anthropic/claude-sonnet-4", "zeta/model"]
+    assert len(server["requests"]) == 1
+    assert "if-none-match" not in server["requests"][0].headers
+    cached = orjson.loads(picker._cache_path("sk-test").read_bytes())
+    assert cached["etag"] == '"v1"' and cached["models"] == models
+
+
+def test_fresh_cache_skips_the_network(server):
+    first = _fetch()
+    second = _fetch()
+
+    assert second == first
+    assert len(server["requests"]) == 1
+
+
+def test_stale_cache_revalidates_with_etag_and_reuses_it_on_304(server):
+    first = _fetch()
+    _age_cache(picker.MODELS_CACHE_TTL + 1)
+
+    assert _fetch() == first
+    assert len(server["requests"]) == 2
+    assert server["requests"][1].headers["if-none-match"] == '"v1"'
+    # The 304 refreshed the timestamp, so the next call stays offline.
+    assert _fetch() == first
+    assert len(server["requests"]) == 2
+
+
+def test_stale_cache_is_replaced_when_the_catalog_changed(server):
+    _fetch()
+    _age_cache(picker.MODELS_CACHE_TTL + 1)
+    server["etag"] = '"v2"'
+    server["body"] = {"data": [{"id": "new/model"}]}
+
+    assert [m["id"] for m in _fetch()] == ["new/model"]
+    assert orjson.loads(picker._cache_path("sk-test").read_bytes())["etag"] == '"v2"'
+
+
+def test_force_refresh_bypasses_the_ttl_but_still_revalidates(server):
+    first = _fetch()
+
+    assert _fetch(force_refresh=True) == first
+    assert len(server["requests"]) == 2
+    assert server["requests"][1].headers["if-none-match"] == '"v1"'
+
+
+@pytest.mark.parametrize("content", [b"{not json", b"[]", b'{"models": "nope"}'])
+def test_corrupt_cache_falls_back_to_a_full_fetch(server, content):
+    path = picker._cache_path("sk-test")
+    path.parent.mkdir(parents=True)
+    path.write_bytes(content)
+
+    assert [m["id"] for m in _fetch()] == ["anthropic/claude-sonnet-4", "zeta/model"]
+    assert "if-none-match" not in server["requests"][0].headers
+    assert orjson.loads(path.read_bytes())["etag"] == '"v1"'
+
+
+def test_cache_is_keyed_by_api_key(server):
+    _fetch()
+    asyncio.run(picker.fetch_models("sk-other"))
+
+    assert len(server["requests"]) == 2
+    assert picker._cache_path("sk-test") != picker._cache_path("sk-other")
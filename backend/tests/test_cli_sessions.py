@@ -0,0 +1,150 @@
+import threading
+
+import pytest
+
+from app.cli import sessions
+from app.cli.conversation import Conversation
+from app.cli.sessions import SessionStore
+
+
+@pytest.fixture()
+def session_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(sessions, "SESSIONS_DIR", tmp_path)
+    monkeypatch.setattr(sessions, "INDEX_PATH", tmp_path / "index.json")
+    return tmp_path
+
+
+@pytest.fixture()
+def store(session_dir):
+    store = SessionStore()
+    yield store
+    store.close()
+
+
+def _conversation(*turns: str) -> Conversation:
+    conversation = Conversation()
+    for i, text in enumerate(turns):
+        if i % 2:
+            conversation.add_assistant_message(text)
+        else:
+            conversation.add_user_message(text)
+    return conversation
+
+
+def test_save_and_load_round_trip(store):
+    session_id = store.save_session(_conversation("hi é", 'say "yo"\n'), "m/model")
+
+    data = store.load_session(session_id)
+
+    assert data["meta"].model == "m/model"
+    assert data["meta"].name == "hi é"
+    assert [(m["role"], m["content"]) for m in data["messages"]] == [
+        ("user", "hi é"),
+        ("assistant", 'say "yo"\n'),
+    ]
+
+
+def test_append_updates_index_counts(store):
+    session_id = store.save_session(_conversation("a", "b"), "m")
+
+    store.append_message(session_id, "user", "c", input_tokens=5)
+    store.append_message(session_id, "assistant", "d", output_tokens=7)
+
+    meta = store.list_sessions()[0]
+    assert meta.message_count == 4
+    assert meta.total_tokens == 12
+
+
+def test_load_sees_unflushed_append(store):
+    session_id = store.save_session(_conversation("a", "b"), "m")
+
+    store.append_message(session_id, "user", "c", flush=False)
+
+    assert [m["content"] for m in store.load_session(session_id)["messages"]] == ["a", "b", "c"]
+
+
+def test_unflushed_append_to_unindexed_session_is_counted(store):
+    session_id = store.save_session(_conversation("a", "b"), "m")
+    store._remove_from_index([session_id])
+
+    store.append_message(session_id, "user", "c", flush=False)
+
+    assert store.list_sessions()[0].message_count == 3
+
+
+def test_delete_survives_a_failing_writer_flush(store):
+    session_id = store.save_session(_conversation("a"), "m")
+    store.append_message(session_id, "user", "b", flush=False)
+    store._writers[session_id].close()
+
+    class _FailingWriter:
+        def close(self) -> None:
+            raise OSError("disk full")
+
+    store._writers[session_id] = _FailingWriter()
+    assert store.delete_session(session_id)
+    assert store.list_sessions() == []
+
+
+def test_index_changes_reach_other_stores(session_dir, store):
+    session_id = store.save_session(_conversation("first"), "m")
+    store.close()
+
+    other = SessionStore()
+    try:
+        assert [s.session_id for s in other.list_sessions()] == [session_id]
+
+        store.append_message(session_id, "assistant", "reply")
+        store.close()
+        assert other.list_sessions()[0].message_count == 2
+    finally:
+        other.close()
+
+
+def test_list_sessions_orders_most_recent_first(store):
+    older = store.save_session(_conversation("one"), "m")
+    newer = store.save_session(_conversation("two"), "m")
+    assert [s.session_id for s in store.list_sessions()] == [newer, older]
+
+    store.append_message(older, "user", "bump")
+    assert [s.session_id for s in store.list_sessions()] == [older, newer]
+
+
+def test_append_to_missing_session_is_ignored(store):
+    store.append_message("missing", "user", "hello")
+    assert store.list_sessions() == []
+    with pytest.raises(FileNotFoundError):
+        store.load_session("missing")
+
+
+def test_delete_and_prune_update_the_index(session_dir, store):
+    kept = store.save_session(_conversation("keep"), "m", name="named")
+    unnamed = [store.save_session(_conversation("x" * 50), "m") for _ in range(3)]
+
+    assert store.delete_session(unnamed[-1])
+    assert not store.delete_session(unnamed[-1])
+    assert store.prune_sessions(max_sessions=1) == 2
+
+    assert [s.session_id for s in store.list_sessions()] == [kept]
+    assert sorted(p.name for p in session_dir.glob("*.jsonl")) == [f"{kept}.jsonl"]
+
+
+def test_listing_while_appends_run_in_worker_threads(store):
+    session_ids = [store.save_session(_conversation(f"s{i}"), "m") for i in range(4)]
+
+    def append_many(session_id: str) -> None:
+        for _ in range(50):
+            store.append_message(session_id, "user", "x", flush=False)
+
+    threads = [threading.Thread(target=append_many, args=(sid,)) for sid in session_ids]
+    for thread in threads:
+        thread.start()
+    while any(thread.is_alive() for thread in threads):
+        assert len(store.list_sessions()) == 4
+    for thread in threads:
+        thread.join()
+
+    sessions = store.list_sessions()
+    assert [s.message_count for s in sessions] == [51] * 4
+    updated = [s.updated_at for s in sessions]
+    assert updated == sorted(updated, reverse=True)
@@ -0,0 +1,83 @@
+import random
+import re
+
+import pytest
+
+from app.cli.smart_router import (
+    _RELEVANCE_THRESHOLD,
+    KEYWORD_SIGNALS,
+    SmartRouter,
+    TaskCategory,
+    TaskClassifier,
+)
+
+
+def _per_keyword_classify(prompt: str) -> list[tuple[TaskCategory, float]]:
+    """The per-keyword regex classifier that the single-pass pattern replaced."""
+    text = prompt.lower()
+    scores = {}
+    for category, keywords in KEYWORD_SIGNALS.items():
+        hits = sum(1 for kw in keywords if re.search(r"\b" + re.escape(kw), text))
+        if hits:
+            scores[category] = hits
+    if not scores:
+        return [(TaskCategory.GENERAL, 1.0)]
+    max_hits = max(scores.values())
+    results = [
+        (category, round(hits / max_hits, 2))
+        for category, hits in scores.items()
+        if round(hits / max_hits, 2) >= _RELEVANCE_THRESHOLD
+    ]
+    results.sort(key=lambda pair: pair[1], reverse=True)
+    return results
+
+
+def _prompts() -> list[str]:
+    keywords = [kw for kws in KEYWORD_SIGNALS.values() for kw in kws]
+    filler = ["the", "code", "please", "x", "unwrite", "prefix", "re", "ing", "?", "\n", "ÉCRIRE"]
+    rng = random.Random(3)
+    prompts = [
+        "",
+        "hello there",
+        "Write a story about a robot",
+        "Analyze code quality and find bugs",
+        "Please FIX this Traceback: error in build",
+        "rewrite, recheck and prebuild",
+        "修复这个错误",
+    ]
+    for _ in range(300):
+        words = [rng.choice(keywords if rng.random() < 0.4 else filler)
+                 for _ in range(rng.randint(1, 12))]
+        sep = rng.choice([" ", "", "-", ". "])
+        prompts.append(sep.join(words))
+    return prompts
+
+
+@pytest.mark.parametrize("prompt", _prompts())
+def test_matches_per_keyword_classifier(prompt):
+    assert TaskClassifier.classify(prompt) == _per_keyword_classify(prompt)
+
+
+def test_route_is_cached_per_prompt():
+    router = SmartRouter(default_model="fallback/model")
+    first = router.route("debug this crash")
+    assert router.route("debug this crash") is first
+    assert first.category is TaskCategory.DEBUGGING
+    assert router.route("explain this").category is TaskCategory.RESEARCH
+
+
+def test_routers_do_not_share_cached_decisions():
+    plain = SmartRouter(default_model="fallback/model")
+    custom = SmartRouter(default_model="fallback/model", route_overrides={"debugging": "x/y"})
+    assert plain.route("fix the bug").model != custom.route("fix the bug").model
+
+
+@pytest.mark.parametrize("prompt", ["修复这个错误", "12345 !?", "ÿÿÿ"])
+def test_prompts_without_keyword_letters_are_general(prompt):
+    assert TaskClassifier.classify(prompt) == [(TaskCategory.GENERAL, 1.0)]
+
+
+def test_only_the_scan_window_is_classified():
+    prompt = "x" * TaskClassifier.MAX_SCAN + " debug this error"
+    assert TaskClassifier.classify(prompt) == [(TaskCategory.GENERAL, 1.0)]
+    assert TaskClassifier.classify("debug this error " + prompt)[0][0] is TaskCategory.DEBUGGING
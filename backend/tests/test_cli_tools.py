@@ -0,0 +1,71 @@
+import json
+import random
+import re
+
+import pytest
+
+from app.cli.tools import ToolCallStreamParser, parse_tool_calls
+
+
+def _regex_parse(text: str) -> list[dict]:
+    """The regex-based parser that ToolCallStreamParser replaced."""
+    calls = []
+    for body in re.findall(r"<tool_call>\s*(\{.*?\})\s*</tool_call>", text, re.DOTALL):
+        try:
+            calls.append(json.loads(body))
+        except json.JSONDecodeError:
+            pass
+    return calls
+
+
+def _call(i: int) -> str:
+    payload = {"tool": "shell", "arguments": {"command": f"echo {i} </tool"}}
+    return f"<tool_call>\n{json.dumps(payload)}\n</tool_call>"
+
+
+def _responses() -> list[str]:
+    rng = random.Random(7)
+    prose = ["Sure, let me look.", "Running it now:\n\n", "<tool", "done.", "```py\nx = 1\n```"]
+    texts = [
+        "",
+        "no tools here",
+        _call(0),
+        f"before {_call(1)} middle {_call(2)} after",
+        "<tool_call>{not json}</tool_call> " + _call(3),
+    ]
+    for _ in range(50):
+        parts = [rng.choice(prose) if rng.random() < 0.6 else _call(rng.randint(0, 99))
+                 for _ in range(rng.randint(1, 8))]
+        texts.append(" ".join(parts))
+    return texts
+
+
+def _feed_in_chunks(text: str, rng: random.Random) -> list[dict]:
+    parser = ToolCallStreamParser()
+    calls = []
+    pos = 0
+    while pos < len(text):
+        size = rng.randint(1, 12)
+        calls.extend(parser.feed(text[pos : pos + size]))
+        pos += size
+    return calls
+
+
+@pytest.mark.parametrize("text", _responses())
+def test_chunked_feed_matches_whole_text(text):
+    rng = random.Random(text)
+    expected = parse_tool_calls(text)
+    for _ in range(5):
+        assert _feed_in_chunks(text, rng) == expected
+
+
+@pytest.mark.parametrize("text", _responses())
+def test_whole_text_matches_regex_parser(text):
+    assert parse_tool_calls(text) == _regex_parse(text)
+
+
+def test_unclosed_block_yields_nothing_until_closed():
+    parser = ToolCallStreamParser()
+    assert parser.feed('<tool_call>{"tool": "read_file", ') == []
+    assert parser.feed('"arguments": {"path": "a"}}') == []
+    assert parser.feed("</tool_call>") == [{"tool": "read_file", "arguments": {"path": "a"}}]
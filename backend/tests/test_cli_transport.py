@@ -0,0 +1,100 @@
+import asyncio
+
+import pytest
+
+from app.cli import transport
+from app.cli.transport import iter_sse_data, request_limiter
+
+STREAM = (
+    b": keep-alive\n\n"
+    b'data: {"choices": [{"delta": {"content": "Hel"}}]}\n\n'
+    b'data:{"choices": [{"delta": {"content": "lo \xc3\xa9"}}]}\r\n\r\n'
+    b"event: ping\n\n"
+    b'data: {"usage": {"prompt_tokens": 3}}\n\n'
+    b"data: [DONE]\n\n"
+    b'data: {"after": "done"}\n\n'
+)
+
+EXPECTED = [
+    b'{"choices": [{"delta": {"content": "Hel"}}]}',
+    b'{"choices": [{"delta": {"content": "lo \xc3\xa9"}}]}',
+    b'{"usage": {"prompt_tokens": 3}}',
+]
+
+
+class _FakeResponse:
+    def __init__(self, chunks: list[bytes]) -> None:
+        self._chunks = chunks
+
+    async def aiter_bytes(self, chunk_size: int | None = None):
+        for chunk in self._chunks:
+            yield chunk
+
+
+def _collect(chunks: list[bytes]) -> list[bytes]:
+    async def run() -> list[bytes]:
+        return [payload async for payload in iter_sse_data(_FakeResponse(chunks))]
+
+    return asyncio.run(run())
+
+
+def test_whole_stream():
+    assert _collect([STREAM]) == EXPECTED
+
+
+@pytest.mark.parametrize("size", [1, 2, 5, 17])
+def test_frames_split_across_chunks(size):
+    chunks = [STREAM[i : i + size] for i in range(0, len(STREAM), size)]
+    assert _collect(chunks) == EXPECTED
+
+
+def test_stream_without_done_marker_ends_with_the_last_full_line():
+    assert _collect([b"data: 1\n", b"data: 2\ndata: 3"]) == [b"1", b"2"]
+
+
+@pytest.fixture()
+def limiter_cap(monkeypatch):
+    """Reset the cached limiter and size it from a mutable cap."""
+    monkeypatch.setattr(transport, "_limiter", None)
+    monkeypatch.setattr(transport, "_limiter_loop", None)
+    cap = {"value": 2}
+    monkeypatch.setattr(transport, "resolve_max_concurrency", lambda: cap["value"])
+    return cap
+
+
+def test_limiter_is_shared_within_a_loop(limiter_cap):
+    async def scenario():
+        return request_limiter(), request_limiter()
+
+    first, second = asyncio.run(scenario())
+    assert first is second
+
+
+def test_limiter_is_rebuilt_for_a_new_loop(limiter_cap):
+    async def scenario():
+        return request_limiter()
+
+    first = asyncio.run(scenario())
+    limiter_cap["value"] = 5
+    second = asyncio.run(scenario())
+
+    assert second is not first
+    assert second._value == 5
+
+
+def test_limiter_bounds_concurrent_requests(limiter_cap):
+    active = peak = 0
+
+    async def request():
+        nonlocal active, peak
+        async with request_limiter():
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+    async def scenario():
+        await asyncio.gather(*(request() for _ in range(6)))
+
+    asyncio.run(scenario())
+    assert peak == 2